@@ -6,21 +6,33 @@
 #
 ##########################################################################################
 
+import os
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 
 
 # ****************************************************************************************
 # Global data and configuration
 # ****************************************************************************************
 
+ROOT_DIR = Path(__file__).resolve().parent.parent
+PROMPTS_DIR = Path(os.getenv('SECTION_PROMPTS_DIR') or (ROOT_DIR / 'prompts' / 'sections'))
+SYSTEM_PROMPT_PATH = Path(os.getenv('SYSTEM_PROMPT_FILE') or (ROOT_DIR / 'prompts' / 'system.md'))
+WORKFLOW_PROMPT_PATH = Path(os.getenv('WORKFLOW_PROMPT_FILE') or (ROOT_DIR / 'prompts' / 'workflow.md'))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Section:
     order: int
     slug: str
     label: str
     description: str
 
+    def __post_init__(self) -> None:
+        # Slugs key every per-article scores dict; interning keeps those lookups on identity.
+        object.__setattr__(self, 'slug', sys.intern(self.slug))
+
 
 SECTIONS = [
     Section(
@@ -466,3 +478,36 @@ FOR_FUN_EXCLUDE_KEYWORDS = [
     'labs',
     'benchmark',
 ]
+
+
+def section_prompt_path(section_slug: str) -> Path:
+    prompt_filename = 'software.md' if section_slug == 'business' else f'{section_slug}.md'
+    return PROMPTS_DIR / prompt_filename
+
+
+def _freeze_keywords(keywords: list[str]) -> tuple[str, ...]:
+    return tuple(sys.intern(keyword.lower()) for keyword in keywords)
+
+
+def _freeze_domains(domains: set[str]) -> frozenset[str]:
+    return frozenset(sys.intern(domain) for domain in domains)
+
+
+# Keyword lists are matched against lowercased article text, so store them lowercased,
+# interned, and immutable once at import.
+KEYWORDS = {slug: _freeze_keywords(keywords) for slug, keywords in KEYWORDS.items()}
+HIGH_SIGNAL_MODEL_RELEASE_KEYWORDS = _freeze_keywords(HIGH_SIGNAL_MODEL_RELEASE_KEYWORDS)
+BUSINESS_PRACTICAL_KEYWORDS = _freeze_keywords(BUSINESS_PRACTICAL_KEYWORDS)
+BUSINESS_ANNOUNCEMENT_KEYWORDS = _freeze_keywords(BUSINESS_ANNOUNCEMENT_KEYWORDS)
+BIG_ANNOUNCEMENT_INTENT_KEYWORDS = _freeze_keywords(BIG_ANNOUNCEMENT_INTENT_KEYWORDS)
+UNDER_THE_RADAR_BUILDER_KEYWORDS = _freeze_keywords(UNDER_THE_RADAR_BUILDER_KEYWORDS)
+PRACTICAL_PROMPT_REQUIRED_KEYWORDS = _freeze_keywords(PRACTICAL_PROMPT_REQUIRED_KEYWORDS)
+PRACTICAL_PROMPT_EXCLUDE_KEYWORDS = _freeze_keywords(PRACTICAL_PROMPT_EXCLUDE_KEYWORDS)
+FOR_FUN_REQUIRED_KEYWORDS = _freeze_keywords(FOR_FUN_REQUIRED_KEYWORDS)
+FOR_FUN_EXCLUDE_KEYWORDS = _freeze_keywords(FOR_FUN_EXCLUDE_KEYWORDS)
+
+# Article domains are interned on construction, so membership tests against these sets
+# resolve on identity after the hash lookup.
+MAINSTREAM_DOMAINS = _freeze_domains(MAINSTREAM_DOMAINS)
+BIG_ANNOUNCEMENT_DOMAINS = _freeze_domains(BIG_ANNOUNCEMENT_DOMAINS)
+LOW_SIGNAL_BIG_ANNOUNCEMENT_DOMAINS = _freeze_domains(LOW_SIGNAL_BIG_ANNOUNCEMENT_DOMAINS)
@@ -14,9 +14,8 @@ import re
 from collections import defaultdict
 from datetime import datetime, timezone
 from functools import lru_cache
-from pathlib import Path
 
-from .llm_utils import LlmUsageTotals, call_chat_completion_json, openai_client_kwargs
+from .llm_utils import LlmUsageTotals, call_chat_completion_json, create_openai_client, openai_available
 from .config import (
     BIG_ANNOUNCEMENT_DOMAINS,
     BUSINESS_ANNOUNCEMENT_KEYWORDS,
@@ -35,16 +34,14 @@ from .config import (
     SECTION_TARGET_MAX,
     SECTION_TARGET_MIN,
     SECTIONS,
+    SYSTEM_PROMPT_PATH,
     UNDER_THE_RADAR_BUILDER_KEYWORDS,
     UNDER_THE_RADAR_INDEPENDENT_PLATFORM_HINTS,
+    WORKFLOW_PROMPT_PATH,
+    section_prompt_path,
 )
 from .models import Article
-from .utils import canonicalize_url, normalize_whitespace
-
-try:
-    from openai import OpenAI
-except ImportError:  # pragma: no cover
-    OpenAI = None
+from .utils import KeywordMatcher, canonicalize_url, normalize_whitespace, url_dedupe_key
 
 
 # ****************************************************************************************
@@ -53,12 +50,51 @@ except ImportError:  # pragma: no cover
 
 log = logging.getLogger(__name__)
 
-ROOT_DIR = Path(__file__).resolve().parent.parent
-PROMPTS_DIR = Path(os.getenv('SECTION_PROMPTS_DIR') or (ROOT_DIR / 'prompts' / 'sections'))
-SYSTEM_PROMPT_PATH = Path(os.getenv('SYSTEM_PROMPT_FILE') or (ROOT_DIR / 'prompts' / 'system.md'))
-WORKFLOW_PROMPT_PATH = Path(os.getenv('WORKFLOW_PROMPT_FILE') or (ROOT_DIR / 'prompts' / 'workflow.md'))
 DEFAULT_CURATION_SYSTEM_PROMPT = 'You are a strict AI news curator. Return JSON only.'
 
+# Every static keyword list consulted during scoring is compiled into one automaton so each
+# article text is scanned once, regardless of how many lists or sections test it.
+MATCHED_KEYWORD_LISTS = (
+    *KEYWORDS.values(),
+    BUSINESS_ANNOUNCEMENT_KEYWORDS,
+    BUSINESS_PRACTICAL_KEYWORDS,
+    BIG_ANNOUNCEMENT_INTENT_KEYWORDS,
+    FOR_FUN_EXCLUDE_KEYWORDS,
+    FOR_FUN_REQUIRED_KEYWORDS,
+    HIGH_SIGNAL_MODEL_RELEASE_KEYWORDS,
+    PRACTICAL_PROMPT_EXCLUDE_KEYWORDS,
+    PRACTICAL_PROMPT_REQUIRED_KEYWORDS,
+    UNDER_THE_RADAR_BUILDER_KEYWORDS,
+)
+KEYWORD_MATCHER = KeywordMatcher(keyword for keywords in MATCHED_KEYWORD_LISTS for keyword in keywords)
+# Per-section branch flags for score_articles, resolved once instead of per article:
+# (slug, section_hint bonus, practical-prompts, under-the-radar, for-fun,
+#  engineering/product-development, business).
+SECTION_SCORING_RULES = tuple(
+    (
+        section.slug,
+        2.2 if section.slug in {'business', 'practical-prompts'} else 4.5,
+        section.slug == 'practical-prompts',
+        section.slug == 'under-the-radar',
+        section.slug == 'for-fun',
+        section.slug in {'engineering', 'product-development'},
+        section.slug == 'business',
+    )
+    for section in SECTIONS
+)
+KEYWORD_SECTIONS = {
+    keyword: tuple(slug for slug, keywords in KEYWORDS.items() if keyword in keywords)
+    for keywords in KEYWORDS.values()
+    for keyword in keywords
+}
+# Recency decay 4 * exp(-hours / 24) sampled in 15-minute buckets out to ~10 days; the tail
+# beyond the table is already effectively zero.
+DECAY_BUCKETS_PER_HOUR = 4
+_DECAY_LUT = tuple(4.0 * math.exp(-i / (24 * DECAY_BUCKETS_PER_HOUR)) for i in range(1024))
+MODEL_NAME_PATTERN = re.compile(r'\b(gpt|claude|gemini|llama|qwen|mistral|deepseek|grok)[\- ]?[a-z0-9\.]*\b')
+TITLE_PUNCTUATION_PATTERN = re.compile(r'[^a-z0-9\s]')
+TITLE_STOPWORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'to', 'for'})
+
 
 # ****************************************************************************************
 # Functions
@@ -67,18 +103,16 @@ DEFAULT_CURATION_SYSTEM_PROMPT = 'You are a strict AI news curator. Return JSON
 
 def dedupe_articles(articles: list[Article]) -> list[Article]:
     unique: dict[str, Article] = {}
+    unique_scores: dict[str, float] = {}
     duplicate_clusters: defaultdict[str, list[Article]] = defaultdict(list)
     for article in articles:
-        key = canonicalize_url(article.url) or normalize_whitespace(article.title).lower()
+        key = url_dedupe_key(article.url) or normalize_whitespace(article.title).lower()
         duplicate_clusters[key].append(article)
-        existing = unique.get(key)
-        if existing is None:
-            unique[key] = article
-            continue
-        existing_score = existing.priority + existing.metrics.get('points', 0) * 0.01
         incoming_score = article.priority + article.metrics.get('points', 0) * 0.01
-        if incoming_score > existing_score:
+        existing_score = unique_scores.get(key)
+        if existing_score is None or incoming_score > existing_score:
             unique[key] = article
+            unique_scores[key] = incoming_score
     deduped = list(unique.values())
     _apply_duplicate_cluster_metadata(
         deduped_articles=deduped,
@@ -89,8 +123,8 @@ def dedupe_articles(articles: list[Article]) -> list[Article]:
 
 def _title_fingerprint(title: str) -> str:
     normalized = normalize_whitespace(title).lower()
-    normalized = re.sub(r'[^a-z0-9\s]', ' ', normalized)
-    tokens = [token for token in normalized.split() if token not in {'the', 'a', 'an', 'and', 'or', 'to', 'for'}]
+    normalized = TITLE_PUNCTUATION_PATTERN.sub(' ', normalized)
+    tokens = [token for token in normalized.split() if token not in TITLE_STOPWORDS]
     if not tokens:
         return ''
     return ' '.join(tokens[:14])
@@ -131,7 +165,8 @@ def _apply_duplicate_cluster_metadata(
                 continue
             existing_cluster_size = int(primary.metrics.get('duplicate_cluster_size', 1))
             primary.metrics['duplicate_cluster_size'] = float(max(existing_cluster_size, len(corroborating_urls)))
-            related_urls = [url for url in corroborating_urls if url and url != canonicalize_url(primary.url)]
+            primary_key = url_dedupe_key(primary.url)
+            related_urls = [url for url in corroborating_urls if url_dedupe_key(url) != primary_key]
             if related_urls:
                 primary.corroborating_urls = _merge_corroborating_urls(
                     existing=primary.corroborating_urls,
@@ -158,17 +193,31 @@ def _apply_duplicate_cluster_metadata(
             )
 
 
-def _keyword_hits(text: str, keywords: list[str]) -> int:
-    lowered = text.lower()
-    return sum(1 for keyword in keywords if keyword in lowered)
+@lru_cache(maxsize=4096)
+def _matched_keywords(text_lower: str) -> frozenset[str]:
+    return frozenset(KEYWORD_MATCHER.matches(text_lower))
+
+
+def _keyword_hits(text_lower: str, keywords: tuple[str, ...]) -> int:
+    matched = _matched_keywords(text_lower)
+    return sum(1 for keyword in keywords if keyword in matched)
+
+
+def _section_hit_counts(text_lower: str) -> dict[str, int]:
+    counts = dict.fromkeys(KEYWORDS, 0)
+    for keyword in _matched_keywords(text_lower):
+        for section_slug in KEYWORD_SECTIONS.get(keyword, ()):
+            counts[section_slug] += 1
+    return counts
 
 
 def _recency_score(article: Article, feed_dt: datetime) -> float:
     if article.published_at is None:
         return 0.0
     delta_hours = (feed_dt - article.published_at).total_seconds() / 3600
-    delta_hours = max(0.0, delta_hours)
-    return max(0.0, 4.0 * math.exp(-delta_hours / 24))
+    if delta_hours <= 0:
+        return _DECAY_LUT[0]
+    return _DECAY_LUT[min(len(_DECAY_LUT) - 1, int(delta_hours * DECAY_BUCKETS_PER_HOUR))]
 
 
 def _is_within_recency_window(article: Article, feed_dt: datetime, max_age_hours: float) -> bool:
@@ -276,14 +325,9 @@ def _business_penalty(article: Article, text_blob: str) -> float:
 
 
 def _has_model_release_signal(text_blob: str) -> bool:
-    if any(keyword in text_blob for keyword in HIGH_SIGNAL_MODEL_RELEASE_KEYWORDS):
+    if _keyword_hits(text_blob, HIGH_SIGNAL_MODEL_RELEASE_KEYWORDS) > 0:
         return True
-    return bool(
-        re.search(
-            r'\b(gpt|claude|gemini|llama|qwen|mistral|deepseek|grok)[\- ]?[a-z0-9\.]*\b',
-            text_blob,
-        )
-    )
+    return bool(MODEL_NAME_PATTERN.search(text_blob))
 
 
 def _is_high_signal_announcement(article: Article, text_blob: str) -> bool:
@@ -418,8 +462,7 @@ def _load_workflow_prompt() -> str:
 
 @lru_cache(maxsize=16)
 def _load_section_prompt(section_slug: str) -> str:
-    prompt_filename = 'software.md' if section_slug == 'business' else f'{section_slug}.md'
-    prompt_path = PROMPTS_DIR / prompt_filename
+    prompt_path = section_prompt_path(section_slug)
     if not prompt_path.exists():
         return ''
     try:
@@ -431,6 +474,7 @@ def _load_section_prompt(section_slug: str) -> str:
 
 def _refresh_article_assignments(articles: list[Article]) -> None:
     for article in articles:
+        article.score_vector = tuple(article.scores.get(section.slug, 0.0) for section in SECTIONS)
         if not article.scores:
             continue
         top_section, top_score = max(article.scores.items(), key=lambda item: item[1])
@@ -497,10 +541,12 @@ def _try_llm_section_adjustments(
 ) -> dict[str, dict]:
     api_key = os.getenv('OPENAI_API_KEY')
     preferred_model = os.getenv('OPENAI_MODEL') or 'gpt-5-mini'
-    if not api_key or OpenAI is None or not candidates:
+    if not api_key or not candidates:
+        return {}
+    client = create_openai_client(api_key)
+    if client is None:
         return {}
 
-    client = OpenAI(api_key=api_key, **openai_client_kwargs())
     payload = _build_llm_curation_payload(section_slug, candidates)
     system_prompt = _load_curation_system_prompt()
     workflow_prompt = _load_workflow_prompt()
@@ -516,7 +562,7 @@ def _try_llm_section_adjustments(
         'Do not hallucinate. Use only provided fields. Prefer original, high-signal, and practical items.\n'
         'Return strict JSON with shape:\n'
         '{"items":[{"id":"...","score":0-10,"exclude":false,"reason":"..."}]}\n'
-        f'Input JSON:\n{json.dumps(payload, ensure_ascii=True)}'
+        f'Input JSON:\n{json.dumps(payload, ensure_ascii=False, separators=(",", ":"))}'
     )
     try:
         response, selected_model, selection_info, temperature_fallback_retry = call_chat_completion_json(
@@ -572,10 +618,10 @@ def _apply_llm_curation_adjustments(
     if not enable_llm_curation:
         log.info('LLM curation disabled via CLI flag.')
         return
-    if OpenAI is None:
-        return
     if not os.getenv('OPENAI_API_KEY'):
         return
+    if not openai_available():
+        return
 
     usage_totals = LlmUsageTotals()
     llm_weight = _llm_curation_weight()
@@ -608,7 +654,7 @@ def _apply_llm_curation_adjustments(
             delta = (llm_score - 5.0) * llm_weight
             if exclude:
                 delta -= exclude_penalty
-            article.scores[section_slug] = round(article.scores.get(section_slug, 0.0) + delta, 3)
+            article.scores[section_slug] = article.scores.get(section_slug, 0.0) + delta
             score_key = section_slug.replace('-', '_')
             article.metrics[f'llm_score_{score_key}'] = llm_score
         log.info('LLM curation adjusted %s candidate(s) for section=%s', len(llm_rows), section_slug)
@@ -618,11 +664,18 @@ def _apply_llm_curation_adjustments(
         _refresh_article_assignments(articles)
 
 
-def score_articles(articles: list[Article], feed_dt: datetime | None = None) -> None:
+def score_articles(
+    articles: list[Article],
+    feed_dt: datetime | None = None,
+    by_section: dict[str, list[Article]] | None = None,
+) -> None:
     if feed_dt is None:
         feed_dt = datetime.now(timezone.utc)
+    curator_boosts = {section.slug: _curator_watchlist_score_boost(section.slug) for section in SECTIONS}
     for article in articles:
         text_blob = article.canonical_text().lower()
+        hits_by_section = _section_hit_counts(text_blob)
+        is_curator_article = _is_curator_watchlist_article(article)
         scores: dict[str, float] = {}
         high_signal_announcement = _is_high_signal_announcement(article, text_blob)
         recency_score = _recency_score(article, feed_dt)
@@ -633,24 +686,27 @@ def score_articles(articles: list[Article], feed_dt: datetime | None = None) ->
         article.metrics['source_quality_score'] = article.source_quality_score
         article.metrics['novelty_score'] = article.novelty_score
         article.metrics['high_signal_announcement'] = 1.0 if high_signal_announcement else 0.0
+        points = article.metrics.get('points', 0.0)
         base = (
             article.priority
             + recency_score
             + (article.source_quality_score * 0.22)
             + (article.novelty_score * 0.16)
         )
-        for section in SECTIONS:
+        for (
+            section_slug,
+            section_hint_bonus,
+            is_practical_prompts,
+            is_under_the_radar,
+            is_for_fun,
+            is_engineering_or_product,
+            is_business,
+        ) in SECTION_SCORING_RULES:
             section_score = base
-            hits = _keyword_hits(text_blob, KEYWORDS.get(section.slug, []))
-            section_score += hits * 1.5
-            if article.section_hint == section.slug:
-                if section.slug == 'business':
-                    section_score += 2.2
-                elif section.slug == 'practical-prompts':
-                    section_score += 2.2
-                else:
-                    section_score += 4.5
-            if section.slug == 'practical-prompts':
+            section_score += hits_by_section.get(section_slug, 0) * 1.5
+            if article.section_hint == section_slug:
+                section_score += section_hint_bonus
+            if is_practical_prompts:
                 prompt_hits = _keyword_hits(text_blob, PRACTICAL_PROMPT_REQUIRED_KEYWORDS)
                 exclude_hits = _keyword_hits(text_blob, PRACTICAL_PROMPT_EXCLUDE_KEYWORDS)
                 section_score += prompt_hits * 1.9
@@ -660,13 +716,13 @@ def score_articles(articles: list[Article], feed_dt: datetime | None = None) ->
                     section_score += 0.4
                 if not _is_practical_prompt_candidate(article, text_blob):
                     section_score -= 6.0
-            if section.slug == 'under-the-radar':
+            elif is_under_the_radar:
                 if article.domain not in MAINSTREAM_DOMAINS:
                     section_score += 1.6
                 else:
                     section_score -= 0.8
                 section_score += _under_the_radar_boost(article, text_blob)
-            if section.slug == 'for-fun':
+            elif is_for_fun:
                 fun_hits = _keyword_hits(text_blob, FOR_FUN_REQUIRED_KEYWORDS)
                 exclude_hits = _keyword_hits(text_blob, FOR_FUN_EXCLUDE_KEYWORDS)
                 section_score += fun_hits * 1.7
@@ -675,50 +731,66 @@ def score_articles(articles: list[Article], feed_dt: datetime | None = None) ->
                     section_score += 5.0
                 else:
                     section_score -= 7.0
-            if section.slug in {'engineering', 'product-development'}:
-                section_score += min(2.0, article.metrics.get('points', 0.0) / 150.0)
-            if section.slug == 'business':
-                section_score += min(1.6, article.metrics.get('points', 0.0) / 260.0)
+            elif is_engineering_or_product:
+                section_score += min(2.0, points / 150.0)
+            elif is_business:
+                section_score += min(1.6, points / 260.0)
                 section_score += _keyword_hits(text_blob, BUSINESS_PRACTICAL_KEYWORDS) * 1.2
                 section_score -= _business_penalty(article, text_blob)
                 if not _is_software_development_candidate(article, text_blob):
                     section_score -= 4.5
             if high_signal_announcement:
-                if section.slug in {'engineering', 'product-development'}:
+                if is_engineering_or_product:
                     section_score += 5.0
-                elif section.slug == 'business':
+                elif is_business:
                     section_score += 2.4
-                elif section.slug == 'for-fun':
+                elif is_for_fun:
                     section_score -= 3.0
-            if _is_curator_watchlist_article(article):
-                section_score += _curator_watchlist_score_boost(section.slug)
-            scores[section.slug] = round(section_score, 3)
+            if is_curator_article:
+                section_score += curator_boosts[section_slug]
+            scores[section_slug] = section_score
+            if by_section is not None and scores[section_slug] > 0:
+                by_section[section_slug].append(article)
         article.scores = scores
         article.confidence_score = _confidence_score(article)
         article.metrics['confidence_score'] = article.confidence_score
     _refresh_article_assignments(articles)
 
 
+def _section_ranking(articles: list[Article], score_index: int, rankings: dict[int, list[Article]]) -> list[Article]:
+    ranking = rankings.get(score_index)
+    if ranking is None:
+        ranking = sorted(articles, key=lambda item: item.score_vector[score_index], reverse=True)
+        rankings[score_index] = ranking
+    return ranking
+
+
+def _ranked_subset(ranking: list[Article], pool: list[Article]) -> list[Article]:
+    # Filtering the stable full ranking yields the same order as sorting the pool itself. Pool
+    # membership is by object, since undeduped copies can share an article id.
+    pool_keys = {id(article) for article in pool}
+    return [article for article in ranking if id(article) in pool_keys]
+
+
 def _pick_candidates(
-    candidates: list[Article],
-    score_key: str,
+    ranked_candidates: list[Article],
     picked_ids: set[str],
     max_items: int,
     domain_cap: int = 2,
 ) -> list[Article]:
     selected: list[Article] = []
-    domain_counts: defaultdict[str, int] = defaultdict(int)
-    sorted_candidates = sorted(candidates, key=lambda item: item.scores.get(score_key, 0.0), reverse=True)
-    for article in sorted_candidates:
+    domain_counts: dict[str, int] = {}
+    for article in ranked_candidates:
         if len(selected) >= max_items:
             break
         if article.id in picked_ids:
             continue
-        if domain_counts[article.domain] >= domain_cap:
+        domain_count = domain_counts.get(article.domain, 0)
+        if domain_count >= domain_cap:
             continue
         selected.append(article)
         picked_ids.add(article.id)
-        domain_counts[article.domain] += 1
+        domain_counts[article.domain] = domain_count + 1
     return selected
 
 
@@ -789,18 +861,21 @@ def curate_sections(
     if feed_dt is None:
         feed_dt = datetime.now(timezone.utc)
     recent_articles: list[Article] = []
+    text_blobs: dict[str, str] = {}
     high_signal_grace_count = 0
     for article in articles:
+        text_blob = article.canonical_text().lower()
         if _is_within_recency_window(article, feed_dt, RECENCY_REQUIRED_HOURS):
             recent_articles.append(article)
+            text_blobs[article.id] = text_blob
             continue
-        text_blob = article.canonical_text().lower()
         if (
             _is_high_signal_announcement(article, text_blob)
             and _is_within_recency_window(article, feed_dt, HIGH_SIGNAL_RECENCY_HOURS)
         ):
             article.metrics['recency_grace_applied'] = 1.0
             recent_articles.append(article)
+            text_blobs[article.id] = text_blob
             high_signal_grace_count += 1
     if high_signal_grace_count > 0:
         log.info(
@@ -809,7 +884,8 @@ def curate_sections(
             HIGH_SIGNAL_RECENCY_HOURS,
         )
     articles = recent_articles
-    score_articles(articles, feed_dt=feed_dt)
+    by_section: dict[str, list[Article]] = {section.slug: [] for section in SECTIONS}
+    score_articles(articles, feed_dt=feed_dt, by_section=by_section)
     sections: dict[str, list[Article]] = {section.slug: [] for section in SECTIONS}
     picked_ids: set[str] = set()
     curator_enabled = _curator_watchlist_enabled()
@@ -818,16 +894,14 @@ def curate_sections(
     curator_min_score = _curator_watchlist_min_score() if curator_enabled else 0.0
     curator_total_selected = 0
 
-    by_section: dict[str, list[Article]] = {section.slug: [] for section in SECTIONS}
-    for article in articles:
-        for section in SECTIONS:
-            if article.scores.get(section.slug, 0.0) > 0:
-                by_section[section.slug].append(article)
     _apply_llm_curation_adjustments(
         articles=articles,
         by_section=by_section,
         enable_llm_curation=enable_llm_curation,
     )
+    # Every candidate, curator, and fallback pool is a subset of articles, so each section is
+    # ranked once after the final score adjustments and pools are filtered from that order.
+    section_rankings: dict[int, list[Article]] = {}
 
     for section in SECTIONS:
         candidate_pool = by_section[section.slug]
@@ -838,14 +912,14 @@ def curate_sections(
             narrowed = [
                 article
                 for article in candidate_pool
-                if _is_practical_prompt_candidate(article, article.canonical_text().lower())
+                if _is_practical_prompt_candidate(article, text_blobs[article.id])
             ]
             candidate_pool = narrowed
         if section.slug == 'business':
             workflow_focused = [
                 article
                 for article in candidate_pool
-                if _is_software_development_candidate(article, article.canonical_text().lower())
+                if _is_software_development_candidate(article, text_blobs[article.id])
             ]
             if workflow_focused:
                 candidate_pool = workflow_focused
@@ -853,7 +927,7 @@ def curate_sections(
             playful_items = [
                 article
                 for article in candidate_pool
-                if _is_for_fun_candidate(article, article.canonical_text().lower())
+                if _is_for_fun_candidate(article, text_blobs[article.id])
             ]
             candidate_pool = playful_items
         picks: list[Article] = []
@@ -868,12 +942,11 @@ def curate_sections(
                 article
                 for article in candidate_pool
                 if _is_curator_watchlist_article(article)
-                and article.scores.get(section.slug, 0.0) >= curator_min_score
+                and article.score_vector[section.order] >= curator_min_score
             ]
             if curator_pool and section_curator_cap > 0:
                 preselected = _pick_candidates(
-                    candidates=curator_pool,
-                    score_key=section.slug,
+                    ranked_candidates=_ranked_subset(_section_ranking(articles, section.order, section_rankings), curator_pool),
                     picked_ids=picked_ids,
                     max_items=section_curator_cap,
                     domain_cap=1,
@@ -891,8 +964,7 @@ def curate_sections(
         if remaining_slots > 0:
             picks.extend(
                 _pick_candidates(
-                    candidates=fill_pool,
-                    score_key=section.slug,
+                    ranked_candidates=_ranked_subset(_section_ranking(articles, section.order, section_rankings), fill_pool),
                     picked_ids=picked_ids,
                     max_items=remaining_slots,
                 )
@@ -917,14 +989,14 @@ def curate_sections(
             narrowed = [
                 article
                 for article in articles
-                if _is_practical_prompt_candidate(article, article.canonical_text().lower())
+                if _is_practical_prompt_candidate(article, text_blobs[article.id])
             ]
             fallback_pool = narrowed
         if section.slug == 'business':
             workflow_focused = [
                 article
                 for article in fallback_pool
-                if _is_software_development_candidate(article, article.canonical_text().lower())
+                if _is_software_development_candidate(article, text_blobs[article.id])
             ]
             if workflow_focused:
                 fallback_pool = workflow_focused
@@ -932,12 +1004,11 @@ def curate_sections(
             playful_items = [
                 article
                 for article in fallback_pool
-                if _is_for_fun_candidate(article, article.canonical_text().lower())
+                if _is_for_fun_candidate(article, text_blobs[article.id])
             ]
             fallback_pool = playful_items
         fallbacks = _pick_candidates(
-            candidates=fallback_pool,
-            score_key=section.slug,
+            ranked_candidates=_ranked_subset(_section_ranking(articles, section.order, section_rankings), fallback_pool),
             picked_ids=picked_ids,
             max_items=needed,
             domain_cap=3,
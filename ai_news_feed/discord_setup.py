@@ -31,16 +31,8 @@ formatter = logging.Formatter(
     '%(asctime)-15s [%(funcName)25s:%(lineno)-5s] %(levelname)-8s %(message)s'
 )
 
-fh = logging.FileHandler('ai_news_feed.log', mode='a')
-fh.setLevel(logging.DEBUG)
-fh.setFormatter(formatter)
-if not any(isinstance(handler, logging.FileHandler) for handler in log.handlers):
-    log.addHandler(fh)
-
 root_log = logging.getLogger()
 root_log.setLevel(logging.INFO)
-if not any(isinstance(handler, logging.FileHandler) for handler in root_log.handlers):
-    root_log.addHandler(fh)
 
 DISCORD_API_BASE = 'https://discord.com/api/v10'
 DEFAULT_BOT_PERMISSIONS = 66560  # VIEW_CHANNEL + READ_MESSAGE_HISTORY
@@ -320,6 +312,18 @@ def _build_feeds_other_rows(guild_id: str, channels: list[dict]) -> list[str]:
 # ****************************************************************************************
 
 
+def _configure_file_logging() -> None:
+    # Opened only once the CLI actually runs, so importing this module does not create the log.
+    if any(isinstance(handler, logging.FileHandler) for handler in root_log.handlers):
+        return
+    fh = logging.FileHandler('ai_news_feed.log', mode='a')
+    fh.setLevel(logging.DEBUG)
+    fh.setFormatter(formatter)
+    if not any(isinstance(handler, logging.FileHandler) for handler in log.handlers):
+        log.addHandler(fh)
+    root_log.addHandler(fh)
+
+
 def handle_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description='Discord setup utility for Daily AI Feed.')
     parser.add_argument('--application-id', default=os.getenv('DISCORD_APPLICATION_ID', '').strip())
@@ -355,6 +359,7 @@ def handle_args() -> argparse.Namespace:
     parser.add_argument('-v', '--verbose', action='store_true', help='Enable verbose output to stdout.')
     parser.add_argument('-q', '--quiet', action='store_true', help='Minimal stdout.')
     args = parser.parse_args()
+    _configure_file_logging()
 
     ch = logging.StreamHandler(sys.stdout)
     if args.verbose:
@@ -6,11 +6,16 @@
 #
 ##########################################################################################
 
+import json
 import logging
 import os
 import re
+import threading
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from urllib.parse import parse_qs, quote, unquote, urljoin, urlparse
 
 try:
@@ -20,13 +25,24 @@ except ImportError:  # pragma: no cover
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:  # pragma: no cover
     requests = None
+    HTTPAdapter = None
+    Retry = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 try:
     import yaml
+    YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 except ImportError:  # pragma: no cover
     yaml = None
+    YAML_SAFE_LOADER = None
 
 try:
     from dateutil import parser as date_parser
@@ -34,7 +50,7 @@ except ImportError:  # pragma: no cover
     date_parser = None
 
 from .models import Article
-from .utils import canonicalize_url, extract_domain, stable_id, strip_html
+from .utils import canonicalize_url, canonicalize_with_domain, extract_domain, stable_id, strip_html
 
 
 # ****************************************************************************************
@@ -73,7 +89,63 @@ AUTO_DISCOVER_REDDIT_EXCLUDED_SUBREDDITS = {
     'news',
 }
 
+SAMPLE_ARTICLE_TEMPLATES = (
+    ('Practical prompt template for code review and test generation', 'practical-prompts'),
+    ('Engineering team replaces flaky tests with AI-generated fixtures', 'engineering'),
+    ('PM team ships weekly experiments with AI-generated specs', 'product-development'),
+    ('Solo founder reaches $42k MRR with AI-native support desk', 'business'),
+    ('Tiny blog shows 10x prompt compression trick for retrieval', 'under-the-radar'),
+    ('AI turns childhood doodles into playable arcade games', 'for-fun'),
+)
 _LINKEDIN_PROFILE_URN_HINT_LOGGED = False
+HACKERNEWS_ITEM_WORKERS = 16
+HACKERNEWS_ALGOLIA_URL = 'https://hn.algolia.com/api/v1/search_by_date'
+HACKERNEWS_ALGOLIA_MAX_HITS = 1000
+X_MAX_PAGES = 5
+EXTRACT_TEXT_PREFERRED_KEYS = ('text', 'commentary', 'shareCommentary', 'description', 'title', 'message')
+EXTRACT_TEXT_PREFERRED_KEY_SET = frozenset(EXTRACT_TEXT_PREFERRED_KEYS)
+LINKEDIN_POINTS_KEYS = ('numLikes', 'likeCount', 'numImpressions')
+LINKEDIN_COMMENTS_KEYS = ('numComments', 'commentCount')
+LINKEDIN_DATE_KEYS = ('publishedAt', 'lastModifiedAt', 'createdAt', 'firstPublishedAt')
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+_FEED_HTTP_CACHE: dict[str, dict] | None = None
+_FEED_HTTP_CACHE_LOCK = threading.Lock()
+_FEED_NOT_MODIFIED = object()
+# Entry HTML is flattened by strip_html, so feedparser's sanitizer and relative-URI rewriting
+# (its two most expensive passes) would only produce markup that is thrown away.
+FEEDPARSER_OPTIONS = {'sanitize_html': False, 'resolve_relative_uris': False}
+FEED_TRUNCATE_MIN_BYTES = 64 * 1024
+FEEDS_SECTION_NAMES = {
+    'urls': 'urls',
+    'url': 'urls',
+    'feeds': 'urls',
+    'rss': 'urls',
+    'linkedin users': 'linkedin-users',
+    'linkedin': 'linkedin-users',
+    'linkedin profiles': 'linkedin-users',
+    'x users': 'x-users',
+    'x': 'x-users',
+    'twitter users': 'x-users',
+    'twitter': 'x-users',
+    'other': 'other',
+    'notes': 'other',
+    'misc': 'other',
+}
+FEEDS_SECTION_NUMBER_PATTERN = re.compile(r'^\d+\.\s*')
+REGISTRY_SLUG_PATTERN = re.compile(r'[^a-z0-9]+')
+X_USERNAME_PATTERN = re.compile(r'@?(?:https?://(?:x|twitter)\.com/)?([A-Za-z0-9_]{1,15})(?:[/?#].*)?', re.DOTALL)
+X_QUERY_FROM_PATTERN = re.compile(r'\bfrom:([A-Za-z0-9_]{1,15})\b', re.IGNORECASE)
+LINKEDIN_PROFILE_URL_PATTERN = re.compile(r'https?://(?:www\.)?linkedin\.com/(?:in|company)/', re.IGNORECASE)
+REDDIT_SUBREDDIT_PATTERN = re.compile(r'^/r/([A-Za-z0-9_]+)/')
+HTML_LINK_TAG_PATTERN = re.compile(r'<link\b[^>]*>', re.IGNORECASE)
+HTML_HREF_PATTERN = re.compile(r'href\s*=\s*[\'"]([^\'"]+)[\'"]', re.IGNORECASE)
+DDG_RESULT_LINK_PATTERN = re.compile(r'<a[^>]+class="[^"]*result__a[^"]*"[^>]+href="([^"]+)"', re.IGNORECASE)
+X_HEADLINE_URL_PATTERN = re.compile(r'https?://\S+')
+X_HEADLINE_RETWEET_BY_PATTERN = re.compile(r'^rt\s+by\s+@\w+:\s*', re.IGNORECASE)
+X_HEADLINE_RETWEET_PATTERN = re.compile(r'^rt\s+@\w+:?\s*', re.IGNORECASE)
+X_HEADLINE_WHITESPACE_PATTERN = re.compile(r'\s+')
+X_HEADLINE_CLAUSE_PATTERN = re.compile(r'(?<=[.!?])\s+|\s+[—-]\s+|\n+|\bwhy it matters\b', re.IGNORECASE)
 WEB_DISCOVERY_QUERIES = {
     'practical-prompts': [
         '"system prompt" software development',
@@ -126,27 +198,11 @@ def _normalize_feeds_section(line: str) -> str | None:
     if not line.startswith('#'):
         return None
     normalized = line.lstrip('#').strip().lower()
-    normalized = re.sub(r'^\d+\.\s*', '', normalized)
-    normalized = normalized.replace('_', ' ')
-    normalized = ' '.join(normalized.split())
-    if normalized in {'urls', 'url', 'feeds', 'rss'}:
-        return 'urls'
-    if normalized in {'linkedin users', 'linkedin', 'linkedin profiles'}:
-        return 'linkedin-users'
-    if normalized in {'x users', 'x', 'twitter users', 'twitter'}:
-        return 'x-users'
-    if normalized in {'other', 'notes', 'misc'}:
-        return 'other'
-    return None
-
-
-def _parse_markdown_list_item(line: str) -> str:
-    stripped = line.strip()
-    if stripped.startswith('- '):
-        return stripped[2:].strip()
-    if stripped.startswith('* '):
-        return stripped[2:].strip()
-    return ''
+    if normalized[:1].isdigit():
+        normalized = FEEDS_SECTION_NUMBER_PATTERN.sub('', normalized)
+    if '_' in normalized:
+        normalized = normalized.replace('_', ' ')
+    return FEEDS_SECTION_NAMES.get(' '.join(normalized.split()))
 
 
 def _parse_registry_entry(raw_entry: str) -> tuple[str, dict]:
@@ -173,6 +229,15 @@ def _parse_registry_tags(metadata: dict) -> list[str]:
     return [tag.strip() for tag in tags_raw.split(',') if tag.strip()]
 
 
+def _first_present(mapping: dict, keys: tuple[str, ...]):
+    # First value that is actually set, so a reported 0 is not skipped in favour of a later key.
+    for key in keys:
+        value = mapping.get(key)
+        if value is not None:
+            return value
+    return None
+
+
 def _safe_float(metadata: dict, key: str, default: float) -> float:
     value = metadata.get(key)
     if not value:
@@ -248,31 +313,20 @@ def _normalize_registry_rss_url(url: str, metadata: dict) -> str:
 
 def _registry_slug(value: str) -> str:
     lower = value.lower().strip()
-    slug = re.sub(r'[^a-z0-9]+', '-', lower).strip('-')
+    slug = REGISTRY_SLUG_PATTERN.sub('-', lower).strip('-')
     return slug or 'source'
 
 
 def _extract_x_username(value: str) -> str:
-    username = value.strip()
-    if username.startswith('@'):
-        username = username[1:]
-    if username.startswith('https://x.com/'):
-        username = username.replace('https://x.com/', '', 1)
-    if username.startswith('http://x.com/'):
-        username = username.replace('http://x.com/', '', 1)
-    if username.startswith('https://twitter.com/'):
-        username = username.replace('https://twitter.com/', '', 1)
-    if username.startswith('http://twitter.com/'):
-        username = username.replace('http://twitter.com/', '', 1)
-    username = username.split('/', 1)[0].split('?', 1)[0].split('#', 1)[0]
-    if re.fullmatch(r'[A-Za-z0-9_]{1,15}', username or ''):
-        return username
+    match = X_USERNAME_PATTERN.fullmatch(value.strip())
+    if match:
+        return match.group(1)
     return ''
 
 
 def _extract_reddit_subreddit(path: str) -> str:
     path_value = (path or '').strip()
-    match = re.match(r'^/r/([A-Za-z0-9_]+)/', path_value)
+    match = REDDIT_SUBREDDIT_PATTERN.match(path_value)
     if not match:
         return ''
     return match.group(1)
@@ -280,14 +334,7 @@ def _extract_reddit_subreddit(path: str) -> str:
 
 def _extract_linkedin_profile_url(value: str) -> str:
     cleaned = value.strip()
-    lowered = cleaned.lower()
-    if lowered.startswith('https://www.linkedin.com/in/') or lowered.startswith('http://www.linkedin.com/in/'):
-        return canonicalize_url(cleaned)
-    if lowered.startswith('https://linkedin.com/in/') or lowered.startswith('http://linkedin.com/in/'):
-        return canonicalize_url(cleaned)
-    if lowered.startswith('https://www.linkedin.com/company/') or lowered.startswith('http://www.linkedin.com/company/'):
-        return canonicalize_url(cleaned)
-    if lowered.startswith('https://linkedin.com/company/') or lowered.startswith('http://linkedin.com/company/'):
+    if LINKEDIN_PROFILE_URL_PATTERN.match(cleaned):
         return canonicalize_url(cleaned)
     return ''
 
@@ -306,15 +353,17 @@ def _parse_feeds_registry(path: str) -> dict[str, list[tuple[str, dict]]]:
     with open(path, 'r', encoding='utf-8') as handle:
         for raw_line in handle:
             line = raw_line.strip()
-            if not line or line.startswith('<!--'):
+            # Only headers and list items matter, so dispatch on the first character and skip
+            # comments, prose and blank lines without further work.
+            marker = line[:1]
+            if marker == '#':
+                section = _normalize_feeds_section(line)
+                if section:
+                    current_section = section
+                    continue
+            if not current_section or marker not in ('-', '*') or line[1:2] != ' ':
                 continue
-            section = _normalize_feeds_section(line)
-            if section:
-                current_section = section
-                continue
-            if not current_section:
-                continue
-            item = _parse_markdown_list_item(line)
+            item = line[2:].strip()
             if not item:
                 continue
             primary, metadata = _parse_registry_entry(item)
@@ -462,7 +511,7 @@ def load_source_config(path: str, feeds_file: str = DEFAULT_FEEDS_FILE) -> list[
     if yaml is None:
         raise RuntimeError('PyYAML is required to load source configuration.')
     with open(path, 'r', encoding='utf-8') as handle:
-        payload = yaml.safe_load(handle) or {}
+        payload = yaml.load(handle, Loader=YAML_SAFE_LOADER) or {}
     sources = payload.get('sources', [])
     if not isinstance(sources, list):
         raise ValueError('config.sources must be a list')
@@ -531,23 +580,185 @@ def _resolve_candidate_base(url: str) -> tuple[str, str] | None:
     return f'{parsed.scheme}://{domain}/', domain
 
 
-def _parse_feed_url_with_timeout(url: str, timeout: int = 20):
+def _http_session():
+    global _HTTP_SESSION
+    session_factory = getattr(requests, 'Session', None)
+    if session_factory is None:
+        return None
+    with _HTTP_SESSION_LOCK:
+        if _HTTP_SESSION is None:
+            session = session_factory()
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=64,
+                # Retry 5xx responses and failed connects only; a read timeout already cost the full
+                # request timeout, so retrying it would hold a fetch worker several times as long.
+                max_retries=Retry(
+                    total=2,
+                    connect=1,
+                    read=0,
+                    backoff_factor=0.3,
+                    status_forcelist=(500, 502, 503, 504),
+                    raise_on_status=False,
+                ),
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers['User-Agent'] = USER_AGENT
+            _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+def _http_get(url: str, **kwargs):
+    # One pooled keep-alive session is shared by every fetcher (and fetch thread).
+    session = _http_session()
+    if session is None:
+        return requests.get(url, **kwargs)
+    return session.get(url, **kwargs)
+
+
+def _response_json(response):
+    # orjson decodes API payloads several times faster than the stdlib decoder behind
+    # response.json(); its decode error subclasses ValueError, so callers handle both alike.
+    content = getattr(response, 'content', None)
+    if orjson is not None and isinstance(content, bytes) and content:
+        return orjson.loads(content)
+    return response.json()
+
+
+def _truncate_feed_body(content: bytes, max_entries: int) -> bytes:
+    # Large feeds often carry far more entries than a source keeps. Splice out everything
+    # between the max_entries-th closing tag and the last one, so the document stays well
+    # formed and feedparser never builds entries that would be sliced off anyway.
+    if max_entries <= 0 or len(content) < FEED_TRUNCATE_MIN_BYTES:
+        return content
+    for closing_tag in (b'</item>', b'</entry>'):
+        cut = content.find(closing_tag)
+        if cut < 0:
+            continue
+        for _ in range(max_entries - 1):
+            cut = content.find(closing_tag, cut + len(closing_tag))
+            if cut < 0:
+                return content
+        cut += len(closing_tag)
+        last = content.rfind(closing_tag) + len(closing_tag)
+        if last <= cut:
+            return content
+        return content[:cut] + content[last:]
+    return content
+
+
+def _parse_feed_response(response, max_entries: int | None = None):
+    # Hand feedparser the HTTP headers it would have seen had it fetched the URL itself, so the
+    # declared charset is used instead of re-sniffing the body encoding.
+    headers = getattr(response, 'headers', None) or {}
+    response_headers = {str(key).lower(): value for key, value in headers.items()}
+    content = response.content
+    if max_entries is not None and isinstance(content, bytes):
+        content = _truncate_feed_body(content, max_entries)
+    return feedparser.parse(content, response_headers=response_headers, **FEEDPARSER_OPTIONS)
+
+
+def _parse_feed_url_with_timeout(
+    url: str,
+    timeout: int = 20,
+    cache_entry: dict | None = None,
+    max_entries: int | None = None,
+):
     if feedparser is None:
         return None
     if requests is None:
-        return feedparser.parse(url, agent=USER_AGENT)
+        return feedparser.parse(url, agent=USER_AGENT, **FEEDPARSER_OPTIONS)
 
     headers = {
         'User-Agent': USER_AGENT,
         'Accept': 'application/rss+xml,application/atom+xml,application/xml,text/xml;q=0.9,*/*;q=0.5',
     }
+    if cache_entry:
+        if cache_entry.get('etag'):
+            headers['If-None-Match'] = cache_entry['etag']
+        if cache_entry.get('modified'):
+            headers['If-Modified-Since'] = cache_entry['modified']
     try:
-        response = requests.get(url, headers=headers, timeout=(5, timeout))
+        response = _http_get(url, headers=headers, timeout=(5, timeout))
     except requests.RequestException:
         return None
+    if response.status_code == 304 and cache_entry:
+        return _FEED_NOT_MODIFIED
     if response.status_code >= 400:
         return None
-    return feedparser.parse(response.content)
+    return _parse_feed_response(response, max_entries)
+
+
+def _feed_http_cache() -> dict[str, dict] | None:
+    global _FEED_HTTP_CACHE
+    cache_path = (os.getenv('FEED_HTTP_CACHE_FILE') or '').strip()
+    if not cache_path:
+        return None
+    with _FEED_HTTP_CACHE_LOCK:
+        if _FEED_HTTP_CACHE is None:
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as handle:
+                    loaded = json.load(handle)
+            except (OSError, ValueError):
+                loaded = {}
+            _FEED_HTTP_CACHE = loaded if isinstance(loaded, dict) else {}
+    return _FEED_HTTP_CACHE
+
+
+def _feed_cache_entry(url: str) -> dict | None:
+    cache = _feed_http_cache()
+    if cache is None:
+        return None
+    entry = cache.get(url)
+    if not isinstance(entry, dict) or not isinstance(entry.get('items'), list):
+        return None
+    return entry
+
+
+def _store_feed_cache_entry(url: str, parsed, items: list[tuple[str, str, str, datetime | None]]) -> None:
+    cache = _feed_http_cache()
+    if cache is None:
+        return
+    response_headers = parsed.get('headers') or {}
+    etag = response_headers.get('etag')
+    modified = response_headers.get('last-modified')
+    with _FEED_HTTP_CACHE_LOCK:
+        if not etag and not modified:
+            cache.pop(url, None)
+            return
+        cache[url] = {
+            'etag': etag,
+            'modified': modified,
+            'items': [
+                [title, link, summary, published_at.isoformat() if published_at else None]
+                for title, link, summary, published_at in items
+            ],
+        }
+
+
+def _cached_feed_items(cache_entry: dict) -> list[tuple[str, str, str, datetime | None]]:
+    items: list[tuple[str, str, str, datetime | None]] = []
+    for title, link, summary, published_iso in cache_entry['items']:
+        published_at = datetime.fromisoformat(published_iso) if published_iso else None
+        items.append((title, link, summary, published_at))
+    return items
+
+
+def save_feed_http_cache() -> None:
+    cache_path = (os.getenv('FEED_HTTP_CACHE_FILE') or '').strip()
+    if not cache_path or _FEED_HTTP_CACHE is None:
+        return
+    with _FEED_HTTP_CACHE_LOCK:
+        payload = json.dumps(_FEED_HTTP_CACHE, ensure_ascii=False)
+    temp_path = f'{cache_path}.tmp'
+    try:
+        os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+        with open(temp_path, 'w', encoding='utf-8') as handle:
+            handle.write(payload)
+        os.replace(temp_path, cache_path)
+    except OSError as exc:
+        log.warning('Could not write feed HTTP cache %s: %s', cache_path, exc)
 
 
 def _is_autodiscovered_source(source: dict) -> bool:
@@ -611,7 +822,7 @@ def _search_duckduckgo_candidates(
     if requests is None:
         return []
     try:
-        response = requests.get(
+        response = _http_get(
             'https://duckduckgo.com/html/',
             params={'q': query},
             headers={'User-Agent': USER_AGENT},
@@ -624,11 +835,7 @@ def _search_duckduckgo_candidates(
     rows: list[tuple[str, str, str, float]] = []
     seen_domains: set[str] = set()
     html = response.text[:500000]
-    pattern = re.compile(
-        r'<a[^>]+class="[^"]*result__a[^"]*"[^>]+href="([^"]+)"',
-        flags=re.IGNORECASE,
-    )
-    for match in pattern.finditer(html):
+    for match in DDG_RESULT_LINK_PATTERN.finditer(html):
         href = match.group(1).strip()
         target_url = _extract_ddg_target_url(href)
         resolved = _resolve_candidate_base(target_url)
@@ -697,14 +904,14 @@ def _extract_feed_links_from_html(html: str, page_url: str) -> list[str]:
     if not html:
         return []
     links: list[str] = []
-    for match in re.finditer(r'<link\b[^>]*>', html, flags=re.IGNORECASE):
+    for match in HTML_LINK_TAG_PATTERN.finditer(html):
         tag = match.group(0)
         lowered = tag.lower()
         if 'href=' not in lowered:
             continue
         if 'rss' not in lowered and 'atom' not in lowered and 'application/xml' not in lowered:
             continue
-        href_match = re.search(r'href\s*=\s*[\'"]([^\'"]+)[\'"]', tag, flags=re.IGNORECASE)
+        href_match = HTML_HREF_PATTERN.search(tag)
         if not href_match:
             continue
         href = href_match.group(1).strip()
@@ -767,7 +974,7 @@ def _discover_feed_url_for_base_url(base_url: str, min_entries: int) -> tuple[st
     candidate_urls: list[str] = []
     page_url = base_url
     try:
-        response = requests.get(base_url, headers=headers, timeout=(5, discovery_timeout))
+        response = _http_get(base_url, headers=headers, timeout=(5, discovery_timeout))
         if response.status_code < 400:
             page_url = response.url or base_url
             candidate_urls.extend(_extract_feed_links_from_html(response.text[:400000], page_url))
@@ -1044,66 +1251,112 @@ def persist_discovered_registry_sources(feeds_file: str, discovered_sources: lis
     return len(pending_lines)
 
 
-def parse_published(entry: dict) -> datetime | None:
-    if date_parser is None:
+@lru_cache(maxsize=4096)
+def _parse_datetime_string(value: str) -> datetime | None:
+    # Feeds overwhelmingly use ISO 8601 or RFC 822 dates, which the stdlib parses far faster
+    # than dateutil; dateutil stays as the fallback for anything irregular.
+    value = value.strip()
+    if not value:
         return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (ValueError, TypeError, IndexError):
+            if date_parser is None:
+                return None
+            try:
+                parsed = date_parser.parse(value)
+            except (ValueError, TypeError, OverflowError):
+                return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def parse_published(entry: dict) -> datetime | None:
+    # feedparser entries are dict subclasses whose get() remaps keys in Python (and warns when
+    # 'updated' falls back to 'published'); plain dict lookups read the parsed fields directly.
     candidates = [
-        entry.get('published'),
-        entry.get('updated'),
-        entry.get('created'),
+        dict.get(entry, 'published'),
+        dict.get(entry, 'updated'),
+        dict.get(entry, 'created'),
     ]
     for candidate in candidates:
-        if not candidate:
-            continue
-        try:
-            parsed = date_parser.parse(candidate)
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=timezone.utc)
-            return parsed.astimezone(timezone.utc)
-        except (ValueError, TypeError):
+        if not candidate or not isinstance(candidate, str):
             continue
+        parsed = _parse_datetime_string(candidate)
+        if parsed is not None:
+            return parsed
     return None
 
 
+def _fetch_source(source: dict) -> list[Article]:
+    source_type = (source.get('type') or '').lower()
+    try:
+        if source_type == 'rss':
+            return fetch_rss_source(source)
+        if source_type == 'hackernews':
+            return fetch_hackernews_source(source)
+        if source_type == 'arxiv':
+            return fetch_arxiv_source(source)
+        if source_type == 'reddit-search':
+            return fetch_reddit_search_source(source)
+        if source_type == 'x':
+            return fetch_x_source(source)
+        if source_type == 'linkedin':
+            return fetch_linkedin_source(source)
+        log.warning('Skipping unsupported source type: %s', source_type)
+    except Exception as exc:  # noqa: BLE001
+        log.warning(
+            'Source fetch failed for %s: %s: %s',
+            source.get('id'),
+            exc.__class__.__name__,
+            exc,
+        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.exception('Traceback for source fetch failure: %s', source.get('id'))
+    return []
+
+
 def fetch_all_sources(sources: list[dict]) -> list[Article]:
     articles: list[Article] = []
     total_sources = len(sources)
-    for idx, source in enumerate(sources, start=1):
-        if idx == 1 or idx == total_sources or idx % 15 == 0:
-            log.info(
-                'Source fetch progress: %s/%s (current=%s).',
-                idx,
-                total_sources,
-                source.get('id'),
-            )
-        source_type = (source.get('type') or '').lower()
-        try:
-            if source_type == 'rss':
-                articles.extend(fetch_rss_source(source))
-            elif source_type == 'hackernews':
-                articles.extend(fetch_hackernews_source(source))
-            elif source_type == 'arxiv':
-                articles.extend(fetch_arxiv_source(source))
-            elif source_type == 'reddit-search':
-                articles.extend(fetch_reddit_search_source(source))
-            elif source_type == 'x':
-                articles.extend(fetch_x_source(source))
-            elif source_type == 'linkedin':
-                articles.extend(fetch_linkedin_source(source))
-            else:
-                log.warning('Skipping unsupported source type: %s', source_type)
-        except Exception as exc:  # noqa: BLE001
-            log.warning(
-                'Source fetch failed for %s: %s: %s',
-                source.get('id'),
-                exc.__class__.__name__,
-                exc,
-            )
-            if log.isEnabledFor(logging.DEBUG):
-                log.exception('Traceback for source fetch failure: %s', source.get('id'))
+    if total_sources == 0:
+        return articles
+    # Fetching is network-bound, so sources run concurrently; map() keeps results in source order.
+    max_workers = min(total_sources, _safe_env_int('FETCH_MAX_WORKERS', default=8, minimum=1, maximum=32))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for idx, (source, source_articles) in enumerate(
+            zip(sources, executor.map(_fetch_source, sources)),
+            start=1,
+        ):
+            if idx == 1 or idx == total_sources or idx % 15 == 0:
+                log.info(
+                    'Source fetch progress: %s/%s (current=%s).',
+                    idx,
+                    total_sources,
+                    source.get('id'),
+                )
+            articles.extend(source_articles)
+    save_feed_http_cache()
     return articles
 
 
+@lru_cache(maxsize=16384)
+def _url_metadata(url: str, title: str) -> tuple[str, str, str]:
+    # Re-fetched and cross-posted items repeat the same URL/title pairs within and across sources.
+    canonical_url, domain = canonicalize_with_domain(url)
+    return canonical_url, domain, stable_id(canonical_url or title, title)
+
+
+@lru_cache(maxsize=1024)
+def _source_tags(tags: tuple[str, ...]) -> frozenset[str]:
+    # Every article from a source carries the same tags, so they share one frozen set.
+    return frozenset(tags)
+
+
 def _make_article(
     source: dict,
     title: str,
@@ -1111,16 +1364,20 @@ def _make_article(
     summary: str,
     published_at: datetime | None,
     metrics: dict | None = None,
+    text_is_clean: bool = False,
 ) -> Article:
-    canonical_url = canonicalize_url(url)
-    domain = extract_domain(canonical_url)
-    article_id = stable_id(canonical_url or title, title)
-    tags = set(source.get('tags') or [])
+    # Social fetchers strip HTML themselves to build headlines; a second pass would be wasted
+    # work and would unescape text such as '&amp;lt;' twice.
+    canonical_url, domain, article_id = _url_metadata(url, title)
+    tags = _source_tags(tuple(source.get('tags') or ()))
+    if not text_is_clean:
+        title = strip_html(title)
+        summary = strip_html(summary)
     return Article(
         id=article_id,
-        title=strip_html(title),
+        title=title,
         url=canonical_url,
-        summary=strip_html(summary),
+        summary=summary,
         source_name=source.get('name', source.get('id', 'Unknown')),
         source_type=source.get('type', 'unknown'),
         domain=domain,
@@ -1139,94 +1396,172 @@ def fetch_rss_source(source: dict) -> list[Article]:
     if not url:
         return []
     max_items = int(source.get('max_items', 20))
-    parsed = _parse_feed_url_with_timeout(url, timeout=20)
+    cache_entry = _feed_cache_entry(url)
+    parsed = _parse_feed_url_with_timeout(url, timeout=20, cache_entry=cache_entry, max_entries=max_items)
     if parsed is None:
         if _is_autodiscovered_source(source):
             log.info('RSS fetch failed for auto-discovered source %s', source.get('id'))
         else:
             log.warning('RSS fetch failed for %s', source.get('id'))
         return []
-    if getattr(parsed, 'bozo', False):
-        if _is_autodiscovered_source(source):
-            log.info('RSS parse warning for auto-discovered source %s', source.get('id'))
-        else:
-            log.warning('RSS parse warning for %s', source.get('id'))
+    if parsed is _FEED_NOT_MODIFIED:
+        items = _cached_feed_items(cache_entry)[:max_items]
+    else:
+        if getattr(parsed, 'bozo', False):
+            if _is_autodiscovered_source(source):
+                log.info('RSS parse warning for auto-discovered source %s', source.get('id'))
+            else:
+                log.warning('RSS parse warning for %s', source.get('id'))
+        items = []
+        for entry in parsed.entries[:max_items]:
+            title = (dict.get(entry, 'title') or '').strip()
+            link = (dict.get(entry, 'link') or '').strip()
+            if not title or not link:
+                continue
+            summary = dict.get(entry, 'summary') or dict.get(entry, 'description') or ''
+            items.append((title, link, summary, parse_published(entry)))
+        _store_feed_cache_entry(url, parsed, items)
     articles: list[Article] = []
-    for entry in parsed.entries[:max_items]:
-        title = entry.get('title', '').strip()
-        link = entry.get('link', '').strip()
-        if not title or not link:
-            continue
-        summary = entry.get('summary') or entry.get('description') or ''
-        published_at = parse_published(entry)
+    for title, link, summary, published_at in items:
         article = _make_article(source, title, link, summary, published_at)
         if article.url:
             articles.append(article)
     return articles
 
 
+def _fetch_hackernews_item(story_id):
+    item_url = f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json'
+    try:
+        return _http_get(item_url, timeout=10)
+    except requests.RequestException:
+        return None
+
+
+def _build_hackernews_article(
+    source: dict,
+    keywords: list[str],
+    title,
+    url,
+    text,
+    unix_ts,
+    points,
+    comments,
+) -> Article | None:
+    title = (title or '').strip()
+    url = (url or '').strip()
+    if not title or not url:
+        return None
+    blob = f"{title} {text or ''}".lower()
+    if keywords and not any(keyword in blob for keyword in keywords):
+        return None
+    published_at = None
+    if unix_ts:
+        published_at = datetime.fromtimestamp(unix_ts, tz=timezone.utc)
+    metrics = {
+        'points': float(points or 0),
+        'comments': float(comments or 0),
+    }
+    return _make_article(
+        source,
+        title=title,
+        url=url,
+        summary=text or '',
+        published_at=published_at,
+        metrics=metrics,
+    )
+
+
+def _fetch_hackernews_algolia(source: dict, max_items: int, keywords: list[str]) -> list[Article]:
+    # One Algolia search returns the latest stories with their metadata, instead of one
+    # Firebase request per item; keywords are sent as optional words so any of them matches.
+    params = {
+        'tags': 'story',
+        'hitsPerPage': max(1, min(max_items, HACKERNEWS_ALGOLIA_MAX_HITS)),
+    }
+    if keywords:
+        params['query'] = ' '.join(keywords)
+        params['optionalWords'] = params['query']
+    try:
+        response = _http_get(HACKERNEWS_ALGOLIA_URL, params=params, timeout=15)
+        response.raise_for_status()
+        payload = _response_json(response) or {}
+    except (requests.RequestException, ValueError) as exc:
+        log.warning('Hacker News source %s Algolia request failed: %s', source.get('id'), exc)
+        return []
+    articles: list[Article] = []
+    for hit in payload.get('hits') or []:
+        article = _build_hackernews_article(
+            source,
+            keywords,
+            title=hit.get('title'),
+            url=hit.get('url'),
+            text=hit.get('story_text'),
+            unix_ts=hit.get('created_at_i'),
+            points=hit.get('points'),
+            comments=hit.get('num_comments'),
+        )
+        if article:
+            articles.append(article)
+    return articles
+
+
 def fetch_hackernews_source(source: dict) -> list[Article]:
     if requests is None:
         raise RuntimeError('requests is required for Hacker News ingestion.')
     endpoint = source.get('endpoint', 'top').strip().lower()
     max_items = int(source.get('max_items', 120))
     keywords = [item.lower() for item in source.get('keywords', [])]
+    if source.get('use_algolia'):
+        return _fetch_hackernews_algolia(source, max_items, keywords)
     story_ids_url = f'https://hacker-news.firebaseio.com/v0/{endpoint}stories.json'
     try:
-        response = requests.get(story_ids_url, timeout=15)
+        response = _http_get(story_ids_url, timeout=15)
         response.raise_for_status()
     except requests.RequestException as exc:
         log.warning('Hacker News source %s request failed: %s', source.get('id'), exc)
         return []
-    story_ids = response.json()[:max_items]
+    story_ids = _response_json(response)[:max_items]
     articles: list[Article] = []
     item_error_count = 0
-    for story_id in story_ids:
-        item_url = f'https://hacker-news.firebaseio.com/v0/item/{story_id}.json'
-        try:
-            item_response = requests.get(item_url, timeout=10)
-        except requests.RequestException:
+    if not story_ids:
+        return articles
+    with ThreadPoolExecutor(max_workers=min(len(story_ids), HACKERNEWS_ITEM_WORKERS)) as executor:
+        item_responses = list(executor.map(_fetch_hackernews_item, story_ids))
+    # Per-item failures are only logged at debug level, so skip building those records otherwise.
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
+    for story_id, item_response in zip(story_ids, item_responses):
+        if item_response is None:
             item_error_count += 1
-            log.debug('Hacker News source %s item fetch failed for story_id=%s.', source.get('id'), story_id)
+            if debug_enabled:
+                log.debug('Hacker News source %s item fetch failed for story_id=%s.', source.get('id'), story_id)
             continue
         if item_response.status_code != 200:
             continue
         try:
-            payload = item_response.json() or {}
+            payload = _response_json(item_response) or {}
         except ValueError:
             item_error_count += 1
-            log.debug(
-                'Hacker News source %s item JSON parse failed for story_id=%s.',
-                source.get('id'),
-                story_id,
-            )
+            if debug_enabled:
+                log.debug(
+                    'Hacker News source %s item JSON parse failed for story_id=%s.',
+                    source.get('id'),
+                    story_id,
+                )
             continue
         if payload.get('type') != 'story':
             continue
-        title = (payload.get('title') or '').strip()
-        url = (payload.get('url') or '').strip()
-        if not title or not url:
-            continue
-        blob = f"{title} {payload.get('text', '')}".lower()
-        if keywords and not any(keyword in blob for keyword in keywords):
-            continue
-        unix_ts = payload.get('time')
-        published_at = None
-        if unix_ts:
-            published_at = datetime.fromtimestamp(unix_ts, tz=timezone.utc)
-        metrics = {
-            'points': float(payload.get('score') or 0),
-            'comments': float(payload.get('descendants') or 0),
-        }
-        article = _make_article(
+        article = _build_hackernews_article(
             source,
-            title=title,
-            url=url,
-            summary=payload.get('text') or '',
-            published_at=published_at,
-            metrics=metrics,
+            keywords,
+            title=payload.get('title'),
+            url=payload.get('url'),
+            text=payload.get('text'),
+            unix_ts=payload.get('time'),
+            points=payload.get('score'),
+            comments=payload.get('descendants'),
         )
-        articles.append(article)
+        if article:
+            articles.append(article)
     if item_error_count:
         log.info(
             'Hacker News source %s skipped %s item(s) due to transient fetch/parse errors.',
@@ -1245,19 +1580,26 @@ def fetch_arxiv_source(source: dict) -> list[Article]:
         'http://export.arxiv.org/api/query?'
         f'search_query={query}&sortBy=submittedDate&sortOrder=descending&start=0&max_results={max_items}'
     )
-    parsed = _parse_feed_url_with_timeout(url, timeout=20)
+    cache_entry = _feed_cache_entry(url)
+    parsed = _parse_feed_url_with_timeout(url, timeout=20, cache_entry=cache_entry)
     if parsed is None:
         log.warning('arXiv source %s request failed.', source.get('id'))
         return []
+    if parsed is _FEED_NOT_MODIFIED:
+        items = _cached_feed_items(cache_entry)
+    else:
+        items = []
+        for entry in parsed.entries:
+            title = (dict.get(entry, 'title') or '').strip()
+            entry_url = (dict.get(entry, 'id') or '').strip()
+            summary = (dict.get(entry, 'summary') or '').strip()
+            if not title or not entry_url:
+                continue
+            items.append((title, entry_url, summary, parse_published(entry)))
+        _store_feed_cache_entry(url, parsed, items)
     articles: list[Article] = []
-    for entry in parsed.entries:
-        title = entry.get('title', '').strip()
-        url = entry.get('id', '').strip()
-        summary = entry.get('summary', '').strip()
-        if not title or not url:
-            continue
-        published_at = parse_published(entry)
-        article = _make_article(source, title, url, summary, published_at)
+    for title, entry_url, summary, published_at in items:
+        article = _make_article(source, title, entry_url, summary, published_at)
         articles.append(article)
     return articles
 
@@ -1284,7 +1626,7 @@ def fetch_reddit_search_source(source: dict) -> list[Article]:
         'User-Agent': USER_AGENT,
     }
     try:
-        response = requests.get(endpoint, headers=headers, params=params, timeout=20)
+        response = _http_get(endpoint, headers=headers, params=params, timeout=20)
     except requests.RequestException:
         fallback_articles = _fetch_reddit_search_rss_fallback(source, max_items=max_items)
         if fallback_articles:
@@ -1298,7 +1640,7 @@ def fetch_reddit_search_source(source: dict) -> list[Article]:
         log.warning('Reddit source %s request failed (%s).', source.get('id'), response.status_code)
         return []
 
-    payload = response.json() or {}
+    payload = _response_json(response) or {}
     children = (payload.get('data') or {}).get('children') or []
     if not isinstance(children, list):
         return []
@@ -1333,7 +1675,7 @@ def fetch_reddit_search_source(source: dict) -> list[Article]:
         )
         if subreddit:
             article.source_name = f'r/{subreddit}'
-            article.tags.add(f'r/{subreddit.lower()}')
+            article.tags = article.tags | {f'r/{subreddit.lower()}'}
         else:
             article.source_name = source.get('name', 'Reddit Search')
         article.source_type = 'reddit'
@@ -1351,21 +1693,7 @@ def _parse_datetime_value(value: str | int | float | dict | None) -> datetime |
             value = value / 1000.0
         return datetime.fromtimestamp(value, tz=timezone.utc)
     if isinstance(value, str):
-        if date_parser is not None:
-            try:
-                parsed = date_parser.parse(value)
-                if parsed.tzinfo is None:
-                    parsed = parsed.replace(tzinfo=timezone.utc)
-                return parsed.astimezone(timezone.utc)
-            except (ValueError, TypeError):
-                return None
-        try:
-            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=timezone.utc)
-            return parsed.astimezone(timezone.utc)
-        except ValueError:
-            return None
+        return _parse_datetime_string(value)
     return None
 
 
@@ -1382,7 +1710,7 @@ def _fetch_reddit_search_rss_fallback(source: dict, max_items: int) -> list[Arti
         't': source.get('time') or 'day',
     }
     try:
-        response = requests.get(
+        response = _http_get(
             rss_url,
             params=params,
             headers={'User-Agent': USER_AGENT},
@@ -1392,7 +1720,7 @@ def _fetch_reddit_search_rss_fallback(source: dict, max_items: int) -> list[Arti
         return []
     if response.status_code >= 400:
         return []
-    parsed = feedparser.parse(response.content)
+    parsed = _parse_feed_response(response)
     if not parsed.entries:
         return []
     articles: list[Article] = []
@@ -1414,6 +1742,7 @@ def _fetch_reddit_search_rss_fallback(source: dict, max_items: int) -> list[Arti
             summary=summary,
             published_at=published_at,
             metrics={},
+            text_is_clean=True,
         )
         article.source_type = 'reddit'
         article.source_name = source.get('name', 'Reddit Search')
@@ -1442,10 +1771,10 @@ def _build_x_headline(content: str, max_words: int = 10, max_chars: int = 80) ->
     if not cleaned:
         return 'X post summary'
 
-    cleaned = re.sub(r'https?://\S+', '', cleaned)
-    cleaned = re.sub(r'(?i)^rt\s+by\s+@\w+:\s*', '', cleaned)
-    cleaned = re.sub(r'(?i)^rt\s+@\w+:?\s*', '', cleaned)
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip(" \t\r\n-–—:;,.")
+    cleaned = X_HEADLINE_URL_PATTERN.sub('', cleaned)
+    cleaned = X_HEADLINE_RETWEET_BY_PATTERN.sub('', cleaned)
+    cleaned = X_HEADLINE_RETWEET_PATTERN.sub('', cleaned)
+    cleaned = X_HEADLINE_WHITESPACE_PATTERN.sub(' ', cleaned).strip(" \t\r\n-–—:;,.")
 
     for prefix in (
         "i'm excited to announce ",
@@ -1461,7 +1790,7 @@ def _build_x_headline(content: str, max_words: int = 10, max_chars: int = 80) ->
 
     clauses = [
         segment.strip(" \t\r\n-–—:;,.")
-        for segment in re.split(r'(?<=[.!?])\s+|\s+[—-]\s+|\n+|\bwhy it matters\b', cleaned, flags=re.IGNORECASE)
+        for segment in X_HEADLINE_CLAUSE_PATTERN.split(cleaned)
         if segment.strip()
     ]
     headline = clauses[0] if clauses else cleaned
@@ -1482,34 +1811,20 @@ def _build_x_headline(content: str, max_words: int = 10, max_chars: int = 80) ->
 
 
 def _extract_text(value) -> str:
-    if value is None:
-        return ''
-    if isinstance(value, str):
-        return value
-    if isinstance(value, list):
-        for item in value:
-            found = _extract_text(item)
-            if found:
-                return found
-        return ''
-    if isinstance(value, dict):
-        preferred_keys = [
-            'text',
-            'commentary',
-            'shareCommentary',
-            'description',
-            'title',
-            'message',
-        ]
-        for key in preferred_keys:
-            if key in value:
-                found = _extract_text(value.get(key))
-                if found:
-                    return found
-        for child in value.values():
-            found = _extract_text(child)
-            if found:
-                return found
+    # Depth-first search for the first non-empty string, trying the preferred text keys of each
+    # object before its other fields; an explicit stack avoids recursion on deep payloads.
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            if node:
+                return node
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            children = [node[key] for key in EXTRACT_TEXT_PREFERRED_KEYS if key in node]
+            children.extend(child for key, child in node.items() if key not in EXTRACT_TEXT_PREFERRED_KEY_SET)
+            stack.extend(reversed(children))
     return ''
 
 
@@ -1519,7 +1834,7 @@ def _extract_x_source_username(source: dict) -> str:
         return username
 
     query = str(source.get('query') or '').strip()
-    match = re.search(r'(?i)\bfrom:([A-Za-z0-9_]{1,15})\b', query)
+    match = X_QUERY_FROM_PATTERN.search(query)
     if match:
         return match.group(1)
     return ''
@@ -1556,14 +1871,14 @@ def _fetch_x_rss_fallback(source: dict, max_items: int) -> list[Article]:
 
     for feed_url in deduped_urls:
         try:
-            response = requests.get(feed_url, headers={'User-Agent': USER_AGENT}, timeout=20)
+            response = _http_get(feed_url, headers={'User-Agent': USER_AGENT}, timeout=20)
         except requests.RequestException:
             continue
 
         if response.status_code >= 400:
             continue
 
-        parsed_feed = feedparser.parse(response.content)
+        parsed_feed = _parse_feed_response(response)
         if not parsed_feed.entries:
             continue
 
@@ -1590,6 +1905,7 @@ def _fetch_x_rss_fallback(source: dict, max_items: int) -> list[Article]:
                 summary=summary,
                 published_at=published_at,
                 metrics={},
+                text_is_clean=True,
             )
             article.source_name = feed_source_name
             articles.append(article)
@@ -1635,34 +1951,54 @@ def fetch_x_source(source: dict) -> list[Article]:
         'user.fields': 'username,name,verified,public_metrics',
         'expansions': 'author_id',
     }
-    response = requests.get(endpoint, headers=headers, params=params, timeout=20)
-    if response.status_code >= 400:
-        fallback_articles = _fetch_x_rss_fallback(source, max_items)
-        if fallback_articles:
-            return fallback_articles
-        if response.status_code == 401:
-            log.warning(
-                'X source %s unauthorized (401). Check X_BEARER_TOKEN.',
-                source.get('id'),
-            )
-        elif response.status_code == 403:
-            log.info(
-                'X source %s forbidden (403). This is expected when recent-search access is unavailable on the current X API plan.',
-                source.get('id'),
-            )
-        else:
-            log.warning('X source %s request failed (%s).', source.get('id'), response.status_code)
-        return []
-
-    payload = response.json() or {}
+    # target_items lets a source backfill past one page; X only hands out the next_token with each
+    # response, so pages are chained here while other sources keep fetching in parallel.
+    target_items = max(max_items, min(_safe_int(source, 'target_items', max_items), max_items * X_MAX_PAGES))
+    tweets: list[dict] = []
     users_by_id = {}
-    for user in payload.get('includes', {}).get('users', []):
-        user_id = user.get('id')
-        if user_id:
-            users_by_id[user_id] = user
+    page_params = params
+    for _ in range(X_MAX_PAGES):
+        response = _http_get(endpoint, headers=headers, params=page_params, timeout=20)
+        if response.status_code >= 400:
+            if tweets:
+                log.info(
+                    'X source %s pagination stopped after %s item(s) (%s).',
+                    source.get('id'),
+                    len(tweets),
+                    response.status_code,
+                )
+                break
+            fallback_articles = _fetch_x_rss_fallback(source, max_items)
+            if fallback_articles:
+                return fallback_articles
+            if response.status_code == 401:
+                log.warning(
+                    'X source %s unauthorized (401). Check X_BEARER_TOKEN.',
+                    source.get('id'),
+                )
+            elif response.status_code == 403:
+                log.info(
+                    'X source %s forbidden (403). This is expected when recent-search access is unavailable on the current X API plan.',
+                    source.get('id'),
+                )
+            else:
+                log.warning('X source %s request failed (%s).', source.get('id'), response.status_code)
+            return []
+
+        payload = _response_json(response) or {}
+        for user in payload.get('includes', {}).get('users', []):
+            user_id = user.get('id')
+            if user_id:
+                users_by_id[user_id] = user
+        tweets.extend(payload.get('data', []))
+        next_token = (payload.get('meta') or {}).get('next_token')
+        # Only sources that ask for more than one page of items follow next_token at all.
+        if not next_token or target_items <= max_items or len(tweets) >= target_items:
+            break
+        page_params = {**params, 'next_token': next_token}
 
     articles: list[Article] = []
-    for tweet in payload.get('data', []):
+    for tweet in tweets[:target_items]:
         tweet_id = str(tweet.get('id') or '').strip()
         text = strip_html(tweet.get('text') or '')
         if not tweet_id or not text:
@@ -1688,6 +2024,7 @@ def fetch_x_source(source: dict) -> list[Article]:
             summary=text,
             published_at=published_at,
             metrics=metrics,
+            text_is_clean=True,
         )
         article.source_name = source_name
         articles.append(article)
@@ -1801,7 +2138,7 @@ def fetch_linkedin_source(source: dict) -> list[Article]:
         'count': max_items,
         'sortBy': 'LAST_MODIFIED',
     }
-    response = requests.get(endpoint, headers=headers, params=params, timeout=20)
+    response = _http_get(endpoint, headers=headers, params=params, timeout=20)
     if response.status_code >= 400:
         error_snippet = _linkedin_error_snippet(response)
         if response.status_code == 401:
@@ -1826,7 +2163,7 @@ def fetch_linkedin_source(source: dict) -> list[Article]:
             )
         return []
 
-    payload = response.json() or {}
+    payload = _response_json(response) or {}
     rows = payload.get('elements') or payload.get('data') or payload.get('results') or []
     if not isinstance(rows, list):
         log.warning('LinkedIn source %s response did not contain a list payload.', source.get('id'))
@@ -1840,23 +2177,21 @@ def fetch_linkedin_source(source: dict) -> list[Article]:
         text = strip_html(_extract_text(row))
         if not text:
             continue
-        published_at = _parse_datetime_value(
-            row.get('publishedAt')
-            or row.get('lastModifiedAt')
-            or row.get('createdAt')
-            or row.get('firstPublishedAt')
-        )
+        published_at = None
+        for key in LINKEDIN_DATE_KEYS:
+            # A zero or blank timestamp means unset, not the 1970 epoch.
+            date_value = row.get(key)
+            if not date_value:
+                continue
+            published_at = _parse_datetime_value(date_value)
+            if published_at is not None:
+                break
         fallback_url = row.get('permalink') or row.get('url')
         url = _build_linkedin_url(post_id, fallback_url)
         social_stats = row.get('socialDetail') or row.get('statistics') or {}
         metrics = {
-            'points': float(
-                social_stats.get('numLikes')
-                or social_stats.get('likeCount')
-                or social_stats.get('numImpressions')
-                or 0
-            ),
-            'comments': float(social_stats.get('numComments') or social_stats.get('commentCount') or 0),
+            'points': float(_first_present(social_stats, LINKEDIN_POINTS_KEYS) or 0),
+            'comments': float(_first_present(social_stats, LINKEDIN_COMMENTS_KEYS) or 0),
         }
         article = _make_article(
             source=source,
@@ -1865,6 +2200,7 @@ def fetch_linkedin_source(source: dict) -> list[Article]:
             summary=text,
             published_at=published_at,
             metrics=metrics,
+            text_is_clean=True,
         )
         articles.append(article)
     log.info(
@@ -1878,7 +2214,7 @@ def fetch_linkedin_source(source: dict) -> list[Article]:
 
 def _linkedin_error_snippet(response) -> str:
     try:
-        payload = response.json() or {}
+        payload = _response_json(response) or {}
     except ValueError:
         payload = {}
     message = payload.get('message') or payload.get('error_description') or ''
@@ -1891,32 +2227,41 @@ def _linkedin_error_snippet(response) -> str:
     return body_text.strip().replace('\n', ' ')[:240]
 
 
-def build_sample_articles() -> list[Article]:
-    now = datetime.now(timezone.utc)
-    templates = [
-        ('Practical prompt template for code review and test generation', 'practical-prompts'),
-        ('Engineering team replaces flaky tests with AI-generated fixtures', 'engineering'),
-        ('PM team ships weekly experiments with AI-generated specs', 'product-development'),
-        ('Solo founder reaches $42k MRR with AI-native support desk', 'business'),
-        ('Tiny blog shows 10x prompt compression trick for retrieval', 'under-the-radar'),
-        ('AI turns childhood doodles into playable arcade games', 'for-fun'),
-    ]
-    articles: list[Article] = []
+@lru_cache(maxsize=1)
+def _sample_article_seeds() -> tuple[tuple[str, str, str, str, frozenset[str], str], ...]:
+    # Everything about the sample articles except the timestamp is fixed, so ids are hashed once.
+    seeds = []
     for idx in range(30):
-        title, hint = templates[idx % len(templates)]
+        title, hint = SAMPLE_ARTICLE_TEMPLATES[idx % len(SAMPLE_ARTICLE_TEMPLATES)]
         url = f'https://example.com/post-{idx}'
-        article = Article(
-            id=stable_id(url, title),
-            title=f'{title} ({idx + 1})',
+        seeds.append(
+            (
+                stable_id(url, title),
+                f'{title} ({idx + 1})',
+                url,
+                f'Sample content for {hint}.',
+                frozenset({hint}),
+                hint,
+            )
+        )
+    return tuple(seeds)
+
+
+def build_sample_articles() -> list[Article]:
+    now = datetime.now(timezone.utc)
+    return [
+        Article(
+            id=article_id,
+            title=title,
             url=url,
-            summary=f'Sample content for {hint}.',
+            summary=summary,
             source_name='Sample Source',
             source_type='sample',
             domain='example.com',
             published_at=now,
             priority=5.0,
-            tags={hint},
+            tags=tags,
             section_hint=hint,
         )
-        articles.append(article)
-    return articles
+        for article_id, title, url, summary, tags, hint in _sample_article_seeds()
+    ]
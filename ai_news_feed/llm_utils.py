@@ -6,10 +6,12 @@
 #
 ##########################################################################################
 
+import importlib.util
 import json
 import logging
 import os
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, fields
 from typing import Any
 
 
@@ -30,6 +32,9 @@ PRICE_TABLE_DEFAULT = {
     'gpt-4o': {'in_per_m': 2.50, 'out_per_m': 10.00},
 }
 
+_OPENAI_CLIENTS: dict[str, Any] = {}
+_OPENAI_CLIENTS_LOCK = threading.Lock()
+
 SAMPLE_OUTPUTS = {
     'summarization': {
         'items': [
@@ -82,6 +87,10 @@ class LlmUsageTotals:
             completion_tokens=completion_tokens,
         )
 
+    def merge(self, other: 'LlmUsageTotals') -> None:
+        for usage_field in fields(self):
+            setattr(self, usage_field.name, getattr(self, usage_field.name) + getattr(other, usage_field.name))
+
     def add_estimate(self, selection_info: dict[str, Any]) -> None:
         if not selection_info:
             return
@@ -165,6 +174,27 @@ def openai_client_kwargs() -> dict[str, Any]:
     }
 
 
+def openai_available() -> bool:
+    return importlib.util.find_spec('openai') is not None
+
+
+def create_openai_client(api_key: str):
+    # The OpenAI SDK takes a few hundred milliseconds to import, so it is only loaded once a
+    # run actually has an API key and something to send. One client per key is shared by
+    # curation and every summarization thread so they reuse its connection pool.
+    with _OPENAI_CLIENTS_LOCK:
+        client = _OPENAI_CLIENTS.get(api_key)
+        if client is not None:
+            return client
+        try:
+            from openai import OpenAI
+        except ImportError:  # pragma: no cover
+            return None
+        client = OpenAI(api_key=api_key, **openai_client_kwargs())
+        _OPENAI_CLIENTS[api_key] = client
+        return client
+
+
 def estimate_tokens(text: str, model: str) -> int:
     try:
         import tiktoken  # type: ignore
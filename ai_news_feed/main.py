@@ -40,17 +40,8 @@ formatter = logging.Formatter(
     '%(asctime)-15s [%(funcName)25s:%(lineno)-5s] %(levelname)-8s %(message)s'
 )
 
-# File handler for logging
-fh = logging.FileHandler('ai_news_feed.log', mode='w')
-fh.setLevel(logging.DEBUG)
-fh.setFormatter(formatter)
-if not any(isinstance(handler, logging.FileHandler) for handler in log.handlers):
-    log.addHandler(fh)
-
 root_log = logging.getLogger()
 root_log.setLevel(logging.INFO)
-if not any(isinstance(handler, logging.FileHandler) for handler in root_log.handlers):
-    root_log.addHandler(fh)
 
 # Avoid noisy and occasionally fragile debug traces from third-party transport loggers.
 for _logger_name in ('httpcore', 'httpx', 'openai'):
@@ -156,6 +147,19 @@ def build_daily_feed(
 # ****************************************************************************************
 
 
+def _configure_file_logging() -> None:
+    # Opened only once the CLI actually runs, so importing this module (or --help) does not
+    # truncate the previous run's log.
+    if any(isinstance(handler, logging.FileHandler) for handler in root_log.handlers):
+        return
+    fh = logging.FileHandler('ai_news_feed.log', mode='w')
+    fh.setLevel(logging.DEBUG)
+    fh.setFormatter(formatter)
+    if not any(isinstance(handler, logging.FileHandler) for handler in log.handlers):
+        log.addHandler(fh)
+    root_log.addHandler(fh)
+
+
 def handle_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description='Generate and publish a daily AI feed.')
     parser.add_argument('--date', help='Date string in YYYY-MM-DD format.', default=None)
@@ -181,6 +185,7 @@ def handle_args() -> argparse.Namespace:
     parser.add_argument('-v', '--verbose', action='store_true', help='Enable verbose output to stdout.')
     parser.add_argument('-q', '--quiet', action='store_true', help='Minimal stdout.')
     args = parser.parse_args()
+    _configure_file_logging()
 
     # Configure stdout logging based on arguments
     ch = logging.StreamHandler(sys.stdout)
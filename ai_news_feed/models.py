@@ -6,6 +6,7 @@
 #
 ##########################################################################################
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -15,7 +16,7 @@ from datetime import datetime
 # ****************************************************************************************
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     id: str
     title: str
@@ -26,10 +27,11 @@ class Article:
     domain: str
     published_at: datetime | None
     priority: float = 1.0
-    tags: set[str] = field(default_factory=set)
+    tags: frozenset[str] = frozenset()
     section_hint: str | None = None
     metrics: dict[str, float] = field(default_factory=dict)
     scores: dict[str, float] = field(default_factory=dict)
+    score_vector: tuple[float, ...] = field(default=(), repr=False)
     assigned_section: str | None = None
     section_score: float = 0.0
     summary_text: str = ''
@@ -46,11 +48,15 @@ class Article:
     first_seen_at: str = ''
     corroborating_urls: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        if self.domain:
+            self.domain = sys.intern(self.domain)
+
     def canonical_text(self) -> str:
         return f'{self.title}\n{self.summary}'.strip()
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyFeed:
     date: str
     generated_at: str
@@ -15,6 +15,11 @@ from html import escape
 from pathlib import Path
 from urllib.parse import quote
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from .config import SECTIONS
 from .models import Article, DailyFeed
 
@@ -467,6 +472,74 @@ SUBSCRIBE_SCRIPT = '''
 })();
 </script>
 '''
+CSS_BYTES = (CSS.strip() + '\n').encode('utf-8')
+SECTION_CARD_HEADERS = {
+    section.slug: (
+        '<section class="section-card">'
+        '<div class="section-banner">'
+        f'<h2 class="section-banner-title">{escape(section.label)}</h2>'
+        f'<p class="section-banner-sub">{escape(section.description)}</p>'
+        '</div>'
+    )
+    for section in SECTIONS
+}
+# Checked in order: (source type, exact domains, domain fragment, icon class, icon name).
+SOURCE_ICON_RULES = (
+    ('linkedin', frozenset(), 'linkedin.com', 'icon-source-linkedin', 'linkedin'),
+    ('x', frozenset({'x.com', 'twitter.com'}), '', 'icon-source-x', 'x'),
+    ('', frozenset(), 'reddit.com', 'icon-source-reddit', 'reddit'),
+    ('', frozenset(), 'arxiv.org', 'icon-source-arxiv', 'arxiv'),
+    ('', frozenset(), 'news.ycombinator.com', 'icon-source-hn', 'hackernews'),
+)
+ICON_SVGS = {
+    'linkedin': (
+        '<svg class="icon-svg" viewBox="0 0 24 24" aria-hidden="true">'
+        '<rect x="2.4" y="2.4" width="19.2" height="19.2" rx="3.2" fill="none" stroke="currentColor" stroke-width="2"/>'
+        '<circle cx="8.1" cy="8.3" r="1.4" fill="currentColor"/>'
+        '<rect x="6.8" y="11.0" width="2.6" height="6.2" fill="currentColor"/>'
+        '<path d="M12 11h2.5v1.2c.6-.9 1.5-1.4 2.8-1.4 2.2 0 3.4 1.4 3.4 4.0v2.4h-2.6v-2.2c0-1.4-.5-2.0-1.6-2.0-1.1 0-1.8.8-1.8 2.1v2.1H12z" fill="currentColor"/>'
+        '</svg>'
+    ),
+    'x': (
+        '<svg class="icon-svg" viewBox="0 0 24 24" aria-hidden="true">'
+        '<path d="M5 4h3.4l3.8 5.1L16.6 4H20l-6.2 7.4L20.2 20h-3.4l-4.4-5.9L7.4 20H4l6.6-7.8z" fill="currentColor"/>'
+        '</svg>'
+    ),
+    'hackernews': (
+        '<svg class="icon-svg" viewBox="0 0 24 24" aria-hidden="true">'
+        '<path d="M6 4h3.2l2.8 5.2L14.8 4H18l-4.4 8v8h-3.2v-8z" fill="currentColor"/>'
+        '</svg>'
+    ),
+    'reddit': (
+        '<svg class="icon-svg" viewBox="0 0 24 24" aria-hidden="true">'
+        '<circle cx="12" cy="13" r="5.2" fill="none" stroke="currentColor" stroke-width="1.8"/>'
+        '<circle cx="9.8" cy="12.6" r="1" fill="currentColor"/>'
+        '<circle cx="14.2" cy="12.6" r="1" fill="currentColor"/>'
+        '<path d="M9.4 15.2c.8.8 1.5 1.1 2.6 1.1s1.8-.3 2.6-1.1" fill="none" stroke="currentColor" stroke-width="1.6" stroke-linecap="round"/>'
+        '<circle cx="17.8" cy="9.2" r="1.4" fill="none" stroke="currentColor" stroke-width="1.6"/>'
+        '<path d="M13 8.4l1.2-3.3 2.4.6" fill="none" stroke="currentColor" stroke-width="1.6" stroke-linecap="round"/>'
+        '</svg>'
+    ),
+    'arxiv': (
+        '<svg class="icon-svg" viewBox="0 0 24 24" aria-hidden="true">'
+        '<path d="M3.8 18 10.9 5.8h2.2L20.2 18h-2.8l-1.5-2.6H8.1L6.6 18zM9.2 13.2h5.6L12 8.6z" fill="currentColor"/>'
+        '</svg>'
+    ),
+    'relevance': (
+        '<svg class="icon-svg" viewBox="0 0 24 24" aria-hidden="true">'
+        '<circle cx="12" cy="12" r="8.2" fill="none" stroke="currentColor" stroke-width="1.8"/>'
+        '<circle cx="12" cy="12" r="4.4" fill="none" stroke="currentColor" stroke-width="1.8"/>'
+        '<circle cx="12" cy="12" r="1.3" fill="currentColor"/>'
+        '</svg>'
+    ),
+}
+DEFAULT_ICON_SVG = (
+    '<svg class="icon-svg" viewBox="0 0 24 24" aria-hidden="true">'
+    '<path d="M8.2 8.6h3.2a2.8 2.8 0 0 1 0 5.6H9.6" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round"/>'
+    '<path d="M15.8 15.4h-3.2a2.8 2.8 0 0 1 0-5.6h1.8" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round"/>'
+    '<path d="M10.1 13.9 13.9 10.1" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round"/>'
+    '</svg>'
+)
 
 
 # ****************************************************************************************
@@ -495,8 +568,8 @@ def _article_to_json(article: Article) -> dict:
         'confidence_score': article.confidence_score,
         'first_seen_at': article.first_seen_at,
         'corroborating_urls': article.corroborating_urls,
-        'section_score': article.section_score,
-        'scores': article.scores,
+        'section_score': round(article.section_score, 3),
+        'scores': {slug: round(score, 3) for slug, score in article.scores.items()},
     }
 
 
@@ -504,76 +577,20 @@ def _source_icon_data(article: Article) -> tuple[str, str, str]:
     domain = (article.domain or '').lower()
     source_type = (article.source_type or '').lower()
     source_name = article.source_name or 'Source'
-
-    if source_type == 'linkedin' or 'linkedin.com' in domain:
-        return source_name, 'icon-source-linkedin', 'linkedin'
-    if source_type == 'x' or domain in {'x.com', 'twitter.com'}:
-        return source_name, 'icon-source-x', 'x'
-    if 'reddit.com' in domain:
-        return source_name, 'icon-source-reddit', 'reddit'
-    if 'arxiv.org' in domain:
-        return source_name, 'icon-source-arxiv', 'arxiv'
-    if 'news.ycombinator.com' in domain:
-        return source_name, 'icon-source-hn', 'hackernews'
+    for rule_type, rule_domains, rule_fragment, icon_class, icon_name in SOURCE_ICON_RULES:
+        if (
+            (rule_type and source_type == rule_type)
+            or domain in rule_domains
+            or (rule_fragment and rule_fragment in domain)
+        ):
+            return source_name, icon_class, icon_name
     if domain:
         return source_name, '', 'favicon'
     return source_name, '', 'source'
 
 
 def _icon_svg(icon_name: str) -> str:
-    if icon_name == 'linkedin':
-        return (
-            '<svg class="icon-svg" viewBox="0 0 24 24" aria-hidden="true">'
-            '<rect x="2.4" y="2.4" width="19.2" height="19.2" rx="3.2" fill="none" stroke="currentColor" stroke-width="2"/>'
-            '<circle cx="8.1" cy="8.3" r="1.4" fill="currentColor"/>'
-            '<rect x="6.8" y="11.0" width="2.6" height="6.2" fill="currentColor"/>'
-            '<path d="M12 11h2.5v1.2c.6-.9 1.5-1.4 2.8-1.4 2.2 0 3.4 1.4 3.4 4.0v2.4h-2.6v-2.2c0-1.4-.5-2.0-1.6-2.0-1.1 0-1.8.8-1.8 2.1v2.1H12z" fill="currentColor"/>'
-            '</svg>'
-        )
-    if icon_name == 'x':
-        return (
-            '<svg class="icon-svg" viewBox="0 0 24 24" aria-hidden="true">'
-            '<path d="M5 4h3.4l3.8 5.1L16.6 4H20l-6.2 7.4L20.2 20h-3.4l-4.4-5.9L7.4 20H4l6.6-7.8z" fill="currentColor"/>'
-            '</svg>'
-        )
-    if icon_name == 'hackernews':
-        return (
-            '<svg class="icon-svg" viewBox="0 0 24 24" aria-hidden="true">'
-            '<path d="M6 4h3.2l2.8 5.2L14.8 4H18l-4.4 8v8h-3.2v-8z" fill="currentColor"/>'
-            '</svg>'
-        )
-    if icon_name == 'reddit':
-        return (
-            '<svg class="icon-svg" viewBox="0 0 24 24" aria-hidden="true">'
-            '<circle cx="12" cy="13" r="5.2" fill="none" stroke="currentColor" stroke-width="1.8"/>'
-            '<circle cx="9.8" cy="12.6" r="1" fill="currentColor"/>'
-            '<circle cx="14.2" cy="12.6" r="1" fill="currentColor"/>'
-            '<path d="M9.4 15.2c.8.8 1.5 1.1 2.6 1.1s1.8-.3 2.6-1.1" fill="none" stroke="currentColor" stroke-width="1.6" stroke-linecap="round"/>'
-            '<circle cx="17.8" cy="9.2" r="1.4" fill="none" stroke="currentColor" stroke-width="1.6"/>'
-            '<path d="M13 8.4l1.2-3.3 2.4.6" fill="none" stroke="currentColor" stroke-width="1.6" stroke-linecap="round"/>'
-            '</svg>'
-        )
-    if icon_name == 'arxiv':
-        return (
-            '<svg class="icon-svg" viewBox="0 0 24 24" aria-hidden="true">'
-            '<path d="M3.8 18 10.9 5.8h2.2L20.2 18h-2.8l-1.5-2.6H8.1L6.6 18zM9.2 13.2h5.6L12 8.6z" fill="currentColor"/>'
-            '</svg>'
-        )
-    if icon_name == 'relevance':
-        return (
-            '<svg class="icon-svg" viewBox="0 0 24 24" aria-hidden="true">'
-            '<circle cx="12" cy="12" r="8.2" fill="none" stroke="currentColor" stroke-width="1.8"/>'
-            '<circle cx="12" cy="12" r="4.4" fill="none" stroke="currentColor" stroke-width="1.8"/>'
-            '<circle cx="12" cy="12" r="1.3" fill="currentColor"/>'
-            '</svg>'
-        )
-    return (
-        '<svg class="icon-svg" viewBox="0 0 24 24" aria-hidden="true">'
-        '<path d="M8.2 8.6h3.2a2.8 2.8 0 0 1 0 5.6H9.6" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round"/>'
-        '<path d="M15.8 15.4h-3.2a2.8 2.8 0 0 1 0-5.6h1.8" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round"/>'
-        '<path d="M10.1 13.9 13.9 10.1" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round"/>'
-        '</svg>'
-    )
+    return ICON_SVGS.get(icon_name, DEFAULT_ICON_SVG)
 
 
 def _favicon_markup(domain: str) -> str:
@@ -721,24 +738,16 @@ def _render_sections(feed: DailyFeed) -> str:
     for section in SECTIONS:
         stories = feed.sections.get(section.slug, [])
         stories_html = ''.join(_render_story(story) for story in stories)
-        cards.append(
-            '<section class="section-card">'
-            '<div class="section-banner">'
-            f'<h2 class="section-banner-title">{escape(section.label)}</h2>'
-            f'<p class="section-banner-sub">{escape(section.description)}</p>'
-            '</div>'
-            f'{stories_html}'
-            '</section>'
-        )
+        cards.append(f'{SECTION_CARD_HEADERS[section.slug]}{stories_html}</section>')
     return ''.join(cards)
 
 
-def _render_archive_links(archive: list[dict]) -> str:
+def _render_archive_links(archive: list[dict], archive_prefix: str = './archive/') -> str:
     lines = []
     for entry in archive[:30]:
         date = entry.get('date', '')
         title = entry.get('title', date)
-        lines.append(f'<li><a href="./archive/{escape(date)}.html">{escape(title)}</a></li>')
+        lines.append(f'<li><a href="{archive_prefix}{escape(date)}.html">{escape(title)}</a></li>')
     return ''.join(lines)
 
 
@@ -795,7 +804,13 @@ def _render_rss(feed: DailyFeed) -> str:
     )
 
 
-def _render_page(feed: DailyFeed, archive: list[dict], title_suffix: str = '') -> str:
+def _render_page(
+    feed: DailyFeed,
+    archive: list[dict],
+    title_suffix: str = '',
+    root_prefix: str = './',
+    archive_prefix: str = './archive/',
+) -> str:
     suffix = f' - {title_suffix}' if title_suffix else ''
     subscribe_endpoint = (os.getenv('NEWSLETTER_SUBSCRIBE_ENDPOINT') or '').strip()
     return f'''<!doctype html>
@@ -804,11 +819,11 @@ def _render_page(feed: DailyFeed, archive: list[dict], title_suffix: str = '') -
     <meta charset="utf-8" />
     <meta name="viewport" content="width=device-width, initial-scale=1" />
     <title>{escape(feed.title)}{escape(suffix)}</title>
-    <link rel="alternate" type="application/rss+xml" title="Daily AI Feed RSS" href="./feed.xml" />
+    <link rel="alternate" type="application/rss+xml" title="Daily AI Feed RSS" href="{root_prefix}feed.xml" />
     <link rel="preconnect" href="https://fonts.googleapis.com" />
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin />
     <link href="https://fonts.googleapis.com/css2?family=IBM+Plex+Sans:wght@400;600;700&family=Space+Grotesk:wght@500;700&display=swap" rel="stylesheet" />
-    <link rel="stylesheet" href="./style.css" />
+    <link rel="stylesheet" href="{root_prefix}style.css" />
   </head>
   <body>
     <div class="wrap">
@@ -817,7 +832,7 @@ def _render_page(feed: DailyFeed, archive: list[dict], title_suffix: str = '') -
         <p class="subline">{escape(feed.intro)}</p>
         {_render_headline_strip(feed)}
         <div class="header-tools">
-          <a class="rss-pill" href="./feed.xml" target="_blank" rel="noopener noreferrer">RSS feed</a>
+          <a class="rss-pill" href="{root_prefix}feed.xml" target="_blank" rel="noopener noreferrer">RSS feed</a>
           <form class="subscribe-form" id="subscribe-form" data-endpoint="{escape(subscribe_endpoint)}" novalidate>
             <label class="sr-only" for="subscribe-email">Email address</label>
             <input
@@ -837,7 +852,7 @@ def _render_page(feed: DailyFeed, archive: list[dict], title_suffix: str = '') -
       <main class="grid">{_render_sections(feed)}</main>
       <aside class="archive">
         <strong>Archive</strong>
-        <ul>{_render_archive_links(archive)}</ul>
+        <ul>{_render_archive_links(archive, archive_prefix)}</ul>
       </aside>
       <footer>
         Generated {escape(feed.generated_at)}. Each item links to original sources and marks inference explicitly.
@@ -850,19 +865,32 @@ def _render_page(feed: DailyFeed, archive: list[dict], title_suffix: str = '') -
 
 
 def _render_archive_page(feed: DailyFeed, archive: list[dict]) -> str:
-    page = _render_page(feed, archive, title_suffix='Archive')
-    return (
-        page.replace('href="./style.css"', 'href="../style.css"')
-        .replace('href="./archive/', 'href="./')
-        .replace('href="./feed.xml"', 'href="../feed.xml"')
-    )
+    # Archive pages live one directory down, next to the other archive pages.
+    return _render_page(feed, archive, title_suffix='Archive', root_prefix='../', archive_prefix='./')
+
+
+def _pretty_json_enabled() -> bool:
+    raw_value = (os.getenv('AI_NEWS_PRETTY_JSON') or '').strip().lower()
+    return raw_value in {'1', 'true', 'yes', 'on'}
+
+
+def _dump_json(payload) -> bytes:
+    pretty = _pretty_json_enabled()
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(payload, ensure_ascii=True, indent=2).encode('utf-8')
+    return json.dumps(payload, ensure_ascii=True, separators=(',', ':')).encode('utf-8')
 
 
 def _read_archive(path: Path) -> list[dict]:
     if not path.exists():
         return []
-    with path.open('r', encoding='utf-8') as handle:
-        payload = json.load(handle)
+    if orjson is not None:
+        payload = orjson.loads(path.read_bytes())
+    else:
+        with path.open('r', encoding='utf-8') as handle:
+            payload = json.load(handle)
     if isinstance(payload, list):
         return payload
     return []
@@ -890,6 +918,16 @@ def _update_archive(existing: list[dict], feed: DailyFeed) -> list[dict]:
     return entries
 
 
+def _write_if_changed(path: Path, content: bytes) -> None:
+    # Static assets rarely change between builds; leaving them untouched keeps mtimes and deploy diffs quiet.
+    try:
+        if path.stat().st_size == len(content) and path.read_bytes() == content:
+            return
+    except OSError:
+        pass
+    path.write_bytes(content)
+
+
 def write_site(feed: DailyFeed, output_dir: str) -> None:
     root = Path(output_dir)
     data_dir = root / 'data'
@@ -912,15 +950,13 @@ def write_site(feed: DailyFeed, output_dir: str) -> None:
             for slug in feed.sections
         },
     }
-    (data_dir / f'{feed.date}.json').write_text(
-        json.dumps(day_payload, ensure_ascii=True, indent=2), encoding='utf-8'
-    )
-    archive_index_path.write_text(json.dumps(archive_data, ensure_ascii=True, indent=2), encoding='utf-8')
-    (root / 'feed.xml').write_text(_render_rss(feed), encoding='utf-8')
-    (root / 'style.css').write_text(CSS.strip() + '\n', encoding='utf-8')
-    (root / '.nojekyll').write_text('', encoding='utf-8')
+    (data_dir / f'{feed.date}.json').write_bytes(_dump_json(day_payload))
+    archive_index_path.write_bytes(_dump_json(archive_data))
+    (root / 'feed.xml').write_bytes(_render_rss(feed).encode('utf-8'))
+    _write_if_changed(root / 'style.css', CSS_BYTES)
+    _write_if_changed(root / '.nojekyll', b'')
 
     index_html = _render_page(feed, archive_data)
     archive_html = _render_archive_page(feed, archive_data)
-    (root / 'index.html').write_text(index_html, encoding='utf-8')
-    (archive_dir / f'{feed.date}.html').write_text(archive_html, encoding='utf-8')
+    (root / 'index.html').write_bytes(index_html.encode('utf-8'))
+    (archive_dir / f'{feed.date}.html').write_bytes(archive_html.encode('utf-8'))
@@ -36,16 +36,8 @@ formatter = logging.Formatter(
     '%(asctime)-15s [%(funcName)25s:%(lineno)-5s] %(levelname)-8s %(message)s'
 )
 
-fh = logging.FileHandler('ai_news_feed.log', mode='a')
-fh.setLevel(logging.DEBUG)
-fh.setFormatter(formatter)
-if not any(isinstance(handler, logging.FileHandler) for handler in log.handlers):
-    log.addHandler(fh)
-
 root_log = logging.getLogger()
 root_log.setLevel(logging.DEBUG)
-if not any(isinstance(handler, logging.FileHandler) for handler in root_log.handlers):
-    root_log.addHandler(fh)
 
 DEFAULT_DB_PATH = 'data/subscribers.db'
 DEFAULT_CONFIRM_TTL_HOURS = 72
@@ -562,6 +554,18 @@ def run_server(db_path: str, host: str, port: int) -> None:
 # ****************************************************************************************
 
 
+def _configure_file_logging() -> None:
+    # Opened only once the CLI actually runs, so importing this module does not create the log.
+    if any(isinstance(handler, logging.FileHandler) for handler in root_log.handlers):
+        return
+    fh = logging.FileHandler('ai_news_feed.log', mode='a')
+    fh.setLevel(logging.DEBUG)
+    fh.setFormatter(formatter)
+    if not any(isinstance(handler, logging.FileHandler) for handler in log.handlers):
+        log.addHandler(fh)
+    root_log.addHandler(fh)
+
+
 def handle_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description='Run Daily AI Feed subscription service.')
     parser.add_argument('--db-path', default=os.getenv('SUBSCRIPTION_DB_PATH') or DEFAULT_DB_PATH)
@@ -572,6 +576,7 @@ def handle_args() -> argparse.Namespace:
     parser.add_argument('-v', '--verbose', action='store_true', help='Enable verbose output to stdout.')
     parser.add_argument('-q', '--quiet', action='store_true', help='Minimal stdout.')
     args = parser.parse_args()
+    _configure_file_logging()
 
     ch = logging.StreamHandler(sys.stdout)
     if args.verbose:
@@ -9,18 +9,16 @@
 import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 from functools import lru_cache
-from pathlib import Path
 from typing import Any
 
-from .llm_utils import LlmUsageTotals, call_chat_completion_json, openai_client_kwargs
+from .config import SYSTEM_PROMPT_PATH, WORKFLOW_PROMPT_PATH, section_prompt_path
+from .llm_utils import LlmUsageTotals, _safe_env_int, call_chat_completion_json, create_openai_client
 from .models import Article
-from .utils import safe_sentence, strip_html
-
-try:
-    from openai import OpenAI
-except ImportError:  # pragma: no cover
-    OpenAI = None
+from .utils import safe_sentence, stable_id, strip_html
 
 
 # ****************************************************************************************
@@ -38,12 +36,17 @@ SECTION_LENSES = {
     'for-fun': 'why this is creative and interesting',
 }
 
+FALLBACK_WHY_TEMPLATES = {
+    slug: f'Direct: This matters for {lens}, based on this update from {{source_name}}.'
+    for slug, lens in SECTION_LENSES.items()
+}
+DEFAULT_FALLBACK_WHY_TEMPLATE = 'Direct: This matters for why this matters, based on this update from {source_name}.'
+
 DEFAULT_SYSTEM_PROMPT = 'You write concise AI-news briefings. Return strict JSON only, no markdown.'
 
-ROOT_DIR = Path(__file__).resolve().parent.parent
-PROMPTS_DIR = Path(os.getenv('SECTION_PROMPTS_DIR') or (ROOT_DIR / 'prompts' / 'sections'))
-SYSTEM_PROMPT_PATH = Path(os.getenv('SYSTEM_PROMPT_FILE') or (ROOT_DIR / 'prompts' / 'system.md'))
-WORKFLOW_PROMPT_PATH = Path(os.getenv('WORKFLOW_PROMPT_FILE') or (ROOT_DIR / 'prompts' / 'workflow.md'))
+ENRICHMENT_CACHE_MAX_AGE_DAYS = 30
+_ENRICHMENT_CACHE: dict[str, dict] | None = None
+_ENRICHMENT_CACHE_LOCK = threading.Lock()
 
 
 # ****************************************************************************************
@@ -51,14 +54,17 @@ WORKFLOW_PROMPT_PATH = Path(os.getenv('WORKFLOW_PROMPT_FILE') or (ROOT_DIR / 'pr
 # ****************************************************************************************
 
 
+@lru_cache(maxsize=4096)
+def _clean_summary(summary: str) -> str:
+    # The payload builder, fallback copy and evidence quote all start from the same stripped text.
+    return strip_html(summary)
+
+
 def _fallback_article_copy(article: Article, section_slug: str) -> tuple[str, str]:
-    source_text = strip_html(article.summary) or article.title
+    source_text = _clean_summary(article.summary or '') or article.title
     summary_text = safe_sentence(source_text, 220)
-    lens = SECTION_LENSES.get(section_slug, 'why this matters')
-    why_text = safe_sentence(
-        f'Direct: This matters for {lens}, based on this update from {article.source_name}.',
-        180,
-    )
+    why_template = FALLBACK_WHY_TEMPLATES.get(section_slug, DEFAULT_FALLBACK_WHY_TEMPLATE)
+    why_text = safe_sentence(why_template.format(source_name=article.source_name), 180)
     return summary_text, why_text
 
 
@@ -91,7 +97,7 @@ def _fallback_action_fields(article: Article, section_slug: str) -> tuple[str, s
 
 
 def _fallback_evidence_quote(article: Article) -> str:
-    text = safe_sentence(strip_html(article.summary) or article.title, 180)
+    text = safe_sentence(_clean_summary(article.summary or '') or article.title, 180)
     words = text.split()
     if not words:
         return ''
@@ -113,8 +119,7 @@ def _load_system_prompt() -> str:
 @lru_cache(maxsize=16)
 def _load_section_prompt(section_slug: str) -> str:
     lens = SECTION_LENSES.get(section_slug, 'why it matters')
-    prompt_filename = 'software.md' if section_slug == 'business' else f'{section_slug}.md'
-    prompt_path = PROMPTS_DIR / prompt_filename
+    prompt_path = section_prompt_path(section_slug)
     if not prompt_path.exists():
         log.warning('Missing section prompt file for %s at %s', section_slug, prompt_path)
         return f'Focus lens: {lens}.'
@@ -140,6 +145,10 @@ def _load_workflow_prompt() -> str:
     return content
 
 
+def _summary_input(article: Article) -> str:
+    return safe_sentence(_clean_summary(article.summary or ''), 360)
+
+
 def _build_payload(articles: list[Article]) -> list[dict[str, Any]]:
     return [
         {
@@ -147,12 +156,98 @@ def _build_payload(articles: list[Article]) -> list[dict[str, Any]]:
             'title': article.title,
             'source': article.source_name,
             'url': article.url,
-            'summary_input': safe_sentence(strip_html(article.summary), 360),
+            'summary_input': _summary_input(article),
         }
         for article in articles
     ]
 
 
+def _enrichment_cache() -> dict[str, dict] | None:
+    global _ENRICHMENT_CACHE
+    cache_path = (os.getenv('ENRICHMENT_CACHE_FILE') or '').strip()
+    if not cache_path:
+        return None
+    with _ENRICHMENT_CACHE_LOCK:
+        if _ENRICHMENT_CACHE is None:
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as handle:
+                    loaded = json.load(handle)
+            except (OSError, ValueError):
+                loaded = {}
+            _ENRICHMENT_CACHE = loaded if isinstance(loaded, dict) else {}
+    return _ENRICHMENT_CACHE
+
+
+def _enrichment_cache_key(model: str, section_slug: str, prompt_digest: str, article: Article) -> str:
+    # Section guidance shapes the copy, so the same article is cached separately per section; the
+    # prompt and input digests make an edited prompt, title or summary go back to the model.
+    input_digest = stable_id(article.title, article.source_name, _summary_input(article))
+    return f'{model}|{section_slug}|{prompt_digest}|{article.id}|{input_digest}'
+
+
+def _cached_enrichment(
+    model: str,
+    section_slug: str,
+    prompt_digest: str,
+    articles: list[Article],
+) -> dict[str, dict[str, str]]:
+    cache = _enrichment_cache()
+    if cache is None:
+        return {}
+    output: dict[str, dict[str, str]] = {}
+    with _ENRICHMENT_CACHE_LOCK:
+        for article in articles:
+            entry = cache.get(_enrichment_cache_key(model, section_slug, prompt_digest, article))
+            if isinstance(entry, dict) and isinstance(entry.get('fields'), dict):
+                output[article.id] = entry['fields']
+    return output
+
+
+def _store_enrichment(
+    model: str,
+    section_slug: str,
+    prompt_digest: str,
+    articles: list[Article],
+    rows: dict[str, dict[str, str]],
+) -> None:
+    cache = _enrichment_cache()
+    if cache is None:
+        return
+    cached_on = date.today().isoformat()
+    with _ENRICHMENT_CACHE_LOCK:
+        for article in articles:
+            row = rows.get(article.id)
+            if row is not None:
+                cache[_enrichment_cache_key(model, section_slug, prompt_digest, article)] = {
+                    'cached_on': cached_on,
+                    'fields': row,
+                }
+
+
+def save_enrichment_cache() -> None:
+    cache_path = (os.getenv('ENRICHMENT_CACHE_FILE') or '').strip()
+    if not cache_path or _ENRICHMENT_CACHE is None:
+        return
+    cutoff = (date.today() - timedelta(days=ENRICHMENT_CACHE_MAX_AGE_DAYS)).isoformat()
+    with _ENRICHMENT_CACHE_LOCK:
+        expired_keys = [
+            key
+            for key, entry in _ENRICHMENT_CACHE.items()
+            if not isinstance(entry, dict) or str(entry.get('cached_on', '')) < cutoff
+        ]
+        for key in expired_keys:
+            del _ENRICHMENT_CACHE[key]
+        payload = json.dumps(_ENRICHMENT_CACHE, ensure_ascii=False)
+    temp_path = f'{cache_path}.tmp'
+    try:
+        os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+        with open(temp_path, 'w', encoding='utf-8') as handle:
+            handle.write(payload)
+        os.replace(temp_path, cache_path)
+    except OSError as exc:
+        log.warning('Could not write enrichment cache %s: %s', cache_path, exc)
+
+
 def _try_openai_enrichment(
     section_slug: str,
     articles: list[Article],
@@ -160,14 +255,27 @@ def _try_openai_enrichment(
 ) -> dict[str, dict[str, str]] | None:
     api_key = os.getenv('OPENAI_API_KEY')
     preferred_model = os.getenv('OPENAI_MODEL') or 'gpt-5-mini'
-    if not api_key or OpenAI is None or not articles:
+    if not api_key or not articles:
         return None
-
-    client = OpenAI(api_key=api_key, **openai_client_kwargs())
-    payload = _build_payload(articles)
     system_prompt = _load_system_prompt()
     workflow_prompt = _load_workflow_prompt()
     section_prompt = _load_section_prompt(section_slug)
+    prompt_digest = stable_id(system_prompt, workflow_prompt, section_prompt)
+    # Articles enriched on an earlier run keep their copy; only new ones go to the model.
+    cached = _cached_enrichment(preferred_model, section_slug, prompt_digest, articles)
+    pending = [article for article in articles if article.id not in cached]
+    if not pending:
+        log.info(
+            'LLM summarization reused cached copy for all %s article(s) in section=%s.',
+            len(articles),
+            section_slug,
+        )
+        return cached
+    client = create_openai_client(api_key)
+    if client is None:
+        return cached or None
+
+    payload = _build_payload(pending)
     lens = SECTION_LENSES.get(section_slug, 'why it matters')
     user_prompt = (
         f'Section: {section_slug}\n'
@@ -187,7 +295,7 @@ def _try_openai_enrichment(
         f'{lens}.\n'
         'No hallucinations. Never make up facts not present in the input rows.\n'
         'Input JSON:\n'
-        f'{json.dumps(payload, ensure_ascii=True)}\n\n'
+        f'{json.dumps(payload, ensure_ascii=False, separators=(",", ":"))}\n\n'
         'Return JSON object with exact shape:\n'
         '{"items":[{"id":"...","summary":"...","why_it_matters":"...","who_should_care":"...",'
         '"suggested_action":"...","time_to_implement":"...","evidence_quote":"...","inference_label":"direct"}]}'
@@ -223,57 +331,79 @@ def _try_openai_enrichment(
                 'evidence_quote': safe_sentence(str(row.get('evidence_quote', '')), 140),
                 'inference_label': str(row.get('inference_label', 'direct')).strip().lower(),
             }
-        return output
+        _store_enrichment(preferred_model, section_slug, prompt_digest, pending, output)
+        return {**cached, **output}
     except Exception as exc:  # noqa: BLE001
         log.warning('OpenAI enrichment failed for section=%s: %s', section_slug, exc)
-        return None
+        return cached or None
+
+
+def _summary_max_workers() -> int:
+    return _safe_env_int('SUMMARY_MAX_WORKERS', default=6, minimum=1, maximum=16)
+
+
+def _apply_enrichment(section_slug: str, articles: list[Article], llm_data: dict[str, dict[str, str]]) -> None:
+    for article in articles:
+        if article.id in llm_data:
+            article.summary_text = llm_data[article.id]['summary']
+            why_text = llm_data[article.id]['why_it_matters']
+            inference_label = llm_data[article.id].get('inference_label') or 'direct'
+            if inference_label not in {'direct', 'inference'}:
+                inference_label = 'direct'
+            if not why_text.lower().startswith('direct:') and not why_text.lower().startswith('inference:'):
+                prefix = 'Inference:' if inference_label == 'inference' else 'Direct:'
+                why_text = f'{prefix} {why_text}'.strip()
+            article.why_it_matters = why_text
+            article.who_should_care = llm_data[article.id].get('who_should_care', '')
+            article.suggested_action = llm_data[article.id].get('suggested_action', '')
+            article.time_to_implement = llm_data[article.id].get('time_to_implement', '')
+            article.evidence_quote = llm_data[article.id].get('evidence_quote', '')
+            article.inference_label = inference_label
+        else:
+            fallback_summary, fallback_why = _fallback_article_copy(article, section_slug)
+            article.summary_text = fallback_summary
+            article.why_it_matters = fallback_why
+            fallback_who, fallback_action, fallback_time = _fallback_action_fields(article, section_slug)
+            article.who_should_care = fallback_who
+            article.suggested_action = fallback_action
+            article.time_to_implement = fallback_time
+            article.evidence_quote = _fallback_evidence_quote(article)
+            article.inference_label = 'direct'
+        if not article.who_should_care:
+            fallback_who, _, _ = _fallback_action_fields(article, section_slug)
+            article.who_should_care = fallback_who
+        if not article.suggested_action:
+            _, fallback_action, _ = _fallback_action_fields(article, section_slug)
+            article.suggested_action = fallback_action
+        if not article.time_to_implement:
+            _, _, fallback_time = _fallback_action_fields(article, section_slug)
+            article.time_to_implement = fallback_time
+        if not article.evidence_quote:
+            article.evidence_quote = _fallback_evidence_quote(article)
+
+
+def _enrich_section(section_slug: str, articles: list[Article]) -> tuple[dict[str, dict[str, str]], LlmUsageTotals]:
+    log.info(
+        'LLM summarization running for section=%s with %s article(s).',
+        section_slug,
+        len(articles),
+    )
+    section_usage = LlmUsageTotals()
+    return _try_openai_enrichment(section_slug, articles, section_usage) or {}, section_usage
 
 
 def enrich_summaries(sections: dict[str, list[Article]]) -> None:
+    if not sections:
+        return
+    # Each section is an independent model round-trip, so they run concurrently; every call
+    # tracks its own usage and the totals are merged in section order afterwards.
+    max_workers = min(len(sections), _summary_max_workers())
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_enrich_section, sections.keys(), sections.values()))
     usage_totals = LlmUsageTotals()
-    for section_slug, articles in sections.items():
-        log.info(
-            'LLM summarization running for section=%s with %s article(s).',
-            section_slug,
-            len(articles),
-        )
-        llm_data = _try_openai_enrichment(section_slug, articles, usage_totals) or {}
-        for article in articles:
-            if article.id in llm_data:
-                article.summary_text = llm_data[article.id]['summary']
-                why_text = llm_data[article.id]['why_it_matters']
-                inference_label = llm_data[article.id].get('inference_label') or 'direct'
-                if inference_label not in {'direct', 'inference'}:
-                    inference_label = 'direct'
-                if not why_text.lower().startswith('direct:') and not why_text.lower().startswith('inference:'):
-                    prefix = 'Inference:' if inference_label == 'inference' else 'Direct:'
-                    why_text = f'{prefix} {why_text}'.strip()
-                article.why_it_matters = why_text
-                article.who_should_care = llm_data[article.id].get('who_should_care', '')
-                article.suggested_action = llm_data[article.id].get('suggested_action', '')
-                article.time_to_implement = llm_data[article.id].get('time_to_implement', '')
-                article.evidence_quote = llm_data[article.id].get('evidence_quote', '')
-                article.inference_label = inference_label
-            else:
-                fallback_summary, fallback_why = _fallback_article_copy(article, section_slug)
-                article.summary_text = fallback_summary
-                article.why_it_matters = fallback_why
-                fallback_who, fallback_action, fallback_time = _fallback_action_fields(article, section_slug)
-                article.who_should_care = fallback_who
-                article.suggested_action = fallback_action
-                article.time_to_implement = fallback_time
-                article.evidence_quote = _fallback_evidence_quote(article)
-                article.inference_label = 'direct'
-            if not article.who_should_care:
-                fallback_who, _, _ = _fallback_action_fields(article, section_slug)
-                article.who_should_care = fallback_who
-            if not article.suggested_action:
-                _, fallback_action, _ = _fallback_action_fields(article, section_slug)
-                article.suggested_action = fallback_action
-            if not article.time_to_implement:
-                _, _, fallback_time = _fallback_action_fields(article, section_slug)
-                article.time_to_implement = fallback_time
-            if not article.evidence_quote:
-                article.evidence_quote = _fallback_evidence_quote(article)
+    for (section_slug, articles), (llm_data, section_usage) in zip(sections.items(), results):
+        usage_totals.merge(section_usage)
+        _apply_enrichment(section_slug, articles, llm_data)
+    save_enrichment_cache()
     if usage_totals.call_count > 0:
         usage_totals.log_summary(log, label='LLM totals')
@@ -9,8 +9,11 @@
 import hashlib
 import html
 import re
+from collections import deque
+from collections.abc import Iterable
 from datetime import datetime, timezone
-from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunparse
 
 
 # ****************************************************************************************
@@ -18,6 +21,11 @@ from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 # ****************************************************************************************
 
 UTM_PREFIXES = ('utm_', 'fbclid', 'gclid', 'mc_cid', 'mc_eid')
+REFERRAL_QUERY_KEYS = frozenset({'ref', 'ref_src', 'ref_url'})
+DEFAULT_PORTS = {'http': ':80', 'https': ':443'}
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+HTML_SCRIPT_STYLE_PATTERN = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+WHITESPACE_PATTERN = re.compile(r'\s+')
 
 
 # ****************************************************************************************
@@ -25,17 +33,72 @@ UTM_PREFIXES = ('utm_', 'fbclid', 'gclid', 'mc_cid', 'mc_eid')
 # ****************************************************************************************
 
 
+class KeywordMatcher:
+    '''
+    Aho-Corasick automaton that reports every keyword found in a text in one linear pass.
+    '''
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[tuple[str, ...]] = [()]
+        for keyword in dict.fromkeys(keywords):
+            if not keyword:
+                continue
+            node = 0
+            for char in keyword:
+                next_node = goto[node].get(char)
+                if next_node is None:
+                    next_node = len(goto)
+                    goto[node][char] = next_node
+                    goto.append({})
+                    outputs.append(())
+                node = next_node
+            outputs[node] += (keyword,)
+
+        # Breadth-first pass computes failure links and folds them into a full transition
+        # table, so matching needs exactly one dict lookup per character.
+        fail = [0] * len(goto)
+        transitions: list[dict[str, int]] = [{} for _ in goto]
+        transitions[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            transitions[node] = {**transitions[fail[node]], **goto[node]}
+            for char, child in goto[node].items():
+                fail[child] = transitions[fail[node]].get(char, 0)
+                outputs[child] += outputs[fail[child]]
+                queue.append(child)
+        self._transitions = transitions
+        self._outputs = outputs
+
+    def matches(self, text: str) -> set[str]:
+        found: set[str] = set()
+        transitions = self._transitions
+        outputs = self._outputs
+        state = 0
+        for char in text:
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+@lru_cache(maxsize=4096)
 def normalize_whitespace(value: str) -> str:
-    return re.sub(r'\s+', ' ', value or '').strip()
+    return WHITESPACE_PATTERN.sub(' ', value or '').strip()
 
 
 def strip_html(value: str) -> str:
-    text = re.sub(r'<[^>]+>', ' ', value or '')
-    text = html.unescape(text)
+    text = value or ''
+    # Most titles and summaries carry no markup or entities, so skip those passes when possible.
+    if '<' in text:
+        text = HTML_TAG_PATTERN.sub(' ', HTML_SCRIPT_STYLE_PATTERN.sub(' ', text))
+    if '&' in text:
+        text = html.unescape(text)
     return normalize_whitespace(text)
 
 
@@ -44,10 +107,23 @@ def stable_id(*parts: str) -> str:
     return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
 
 
+@lru_cache(maxsize=4096)
 def canonicalize_url(url: str) -> str:
+    return canonicalize_with_domain(url)[0]
+
+
+@lru_cache(maxsize=4096)
+def canonicalize_with_domain(url: str) -> tuple[str, str]:
+    # One urlparse yields both the canonical URL and its domain.
     if not url:
-        return ''
+        return '', ''
+    if url.startswith(('https://', 'http://')) and url.isprintable() and not any(char in url for char in '?#;[]'):
+        # Already canonical: nothing to drop and a lowercase host, which is the usual feed link.
+        netloc = url.split('/', 3)[2]
+        if netloc and netloc == netloc.lower():
+            return url, netloc.replace('www.', '')
     parsed = urlparse(url)
+    netloc = parsed.netloc.lower()
     query_pairs = [
         (key, value)
         for key, value in parse_qsl(parsed.query, keep_blank_values=False)
@@ -57,11 +133,34 @@ def canonicalize_url(url: str) -> str:
         query=urlencode(query_pairs),
         fragment='',
         scheme=parsed.scheme.lower(),
-        netloc=parsed.netloc.lower(),
+        netloc=netloc,
     )
-    return urlunparse(cleaned)
+    return urlunparse(cleaned), netloc.replace('www.', '')
 
 
+@lru_cache(maxsize=4096)
+def url_dedupe_key(url: str) -> str:
+    # Looser than canonicalize_url: scheme, www., default ports, trailing slashes and referral
+    # params never distinguish two articles, but are kept in the links we publish.
+    canonical_url = canonicalize_url(url)
+    if not canonical_url:
+        return ''
+    parsed = urlsplit(canonical_url)
+    netloc = parsed.netloc.removeprefix('www.')
+    default_port = DEFAULT_PORTS.get(parsed.scheme)
+    if default_port and netloc.endswith(default_port):
+        netloc = netloc[: -len(default_port)]
+    query = parsed.query
+    if query:
+        query_pairs = parse_qsl(query)
+        kept_pairs = [(key, value) for key, value in query_pairs if key.lower() not in REFERRAL_QUERY_KEYS]
+        if len(kept_pairs) != len(query_pairs):
+            query = urlencode(kept_pairs)
+    key = f'{netloc}{parsed.path.rstrip("/")}'
+    return f'{key}?{query}' if query else key
+
+
+@lru_cache(maxsize=4096)
 def extract_domain(url: str) -> str:
     parsed = urlparse(url or '')
     return parsed.netloc.lower().replace('www.', '')
@@ -8,7 +8,15 @@
 
 from datetime import datetime, timezone
 
-from ai_news_feed.curation import curate_sections, dedupe_articles, score_articles
+from ai_news_feed.config import KEYWORDS, PRACTICAL_PROMPT_REQUIRED_KEYWORDS
+from ai_news_feed.curation import (
+    _keyword_hits,
+    _ranked_subset,
+    _section_hit_counts,
+    curate_sections,
+    dedupe_articles,
+    score_articles,
+)
 from ai_news_feed.fetchers import build_sample_articles
 from ai_news_feed.models import Article
 
@@ -473,3 +481,64 @@ def test_score_articles_populates_provenance_and_confidence_fields() -> None:
     assert 0.0 <= article.recency_score <= 10.0
     assert 0.0 <= article.novelty_score <= 10.0
     assert 0.0 <= article.confidence_score <= 10.0
+
+
+def test_keyword_hits_match_substring_semantics() -> None:
+    text = 'A Prompt Template library with prompts for CI and the agents.md file'
+    lowered = text.lower()
+    expected = sum(1 for keyword in PRACTICAL_PROMPT_REQUIRED_KEYWORDS if keyword in lowered)
+    assert _keyword_hits(lowered, PRACTICAL_PROMPT_REQUIRED_KEYWORDS) == expected
+    hit_counts = _section_hit_counts(lowered)
+    for section_slug, keywords in KEYWORDS.items():
+        assert hit_counts[section_slug] == sum(1 for keyword in keywords if keyword in lowered)
+
+
+def test_dedupe_articles_merges_cosmetic_url_variants() -> None:
+    first = Article(
+        id='v1',
+        title='Agent workflow teardown with concrete code',
+        url='https://www.example.com/post-a/',
+        summary='A detailed workflow and implementation walk-through.',
+        source_name='Example One',
+        source_type='rss',
+        domain='example.com',
+        published_at=datetime(2026, 3, 4, 11, 0, tzinfo=timezone.utc),
+        priority=6.0,
+    )
+    second = Article(
+        id='v2',
+        title='Agent workflow teardown with concrete code',
+        url='http://example.com/post-a?ref=hn',
+        summary='A detailed workflow and implementation walk-through.',
+        source_name='Example Two',
+        source_type='hackernews',
+        domain='example.com',
+        published_at=datetime(2026, 3, 4, 11, 10, tzinfo=timezone.utc),
+        priority=6.2,
+    )
+    deduped = dedupe_articles([first, second])
+    assert [item.id for item in deduped] == ['v2']
+    assert deduped[0].metrics.get('duplicate_cluster_size') == 2.0
+    assert deduped[0].corroborating_urls == []
+
+
+def test_ranked_subset_keeps_only_pool_objects_when_ids_collide() -> None:
+    def _copy(source_name: str) -> Article:
+        return Article(
+            id='shared-id',
+            title='Agent evals in practice',
+            url='https://example.com/agent-evals',
+            summary='',
+            source_name=source_name,
+            source_type='rss',
+            domain='example.com',
+            published_at=None,
+            priority=1.0,
+        )
+
+    outsider = _copy('Outside Feed')
+    member = _copy('Pool Feed')
+    ranking = [outsider, member]
+
+    assert _ranked_subset(ranking, [member]) == [member]
+    assert _ranked_subset(ranking, [member])[0] is member
@@ -0,0 +1,47 @@
+##########################################################################################
+#
+# Script name: test_fetchers_all_sources.py
+#
+# Description: Tests concurrent fetch dispatch across configured sources.
+#
+##########################################################################################
+
+import time
+
+from ai_news_feed import fetchers
+from ai_news_feed.models import Article
+
+
+def _article(article_id: str) -> Article:
+    return Article(
+        id=article_id,
+        title=f'Story {article_id}',
+        url=f'https://example.com/{article_id}',
+        summary='',
+        source_name='Example',
+        source_type='rss',
+        domain='example.com',
+        published_at=None,
+        priority=1.0,
+    )
+
+
+def test_fetch_all_sources_keeps_source_order_and_isolates_failures(monkeypatch) -> None:
+    def _fake_rss(source: dict) -> list[Article]:
+        if source['id'] == 'broken':
+            raise RuntimeError('feed exploded')
+        time.sleep(source['delay'])
+        return [_article(source['id'])]
+
+    monkeypatch.setattr(fetchers, 'fetch_rss_source', _fake_rss)
+    monkeypatch.setenv('FETCH_MAX_WORKERS', '4')
+
+    sources = [
+        {'id': 'slow', 'type': 'rss', 'delay': 0.05},
+        {'id': 'broken', 'type': 'rss', 'delay': 0.0},
+        {'id': 'fast', 'type': 'rss', 'delay': 0.0},
+        {'id': 'unknown', 'type': 'gopher'},
+    ]
+    articles = fetchers.fetch_all_sources(sources)
+
+    assert [article.id for article in articles] == ['slow', 'fast']
@@ -0,0 +1,34 @@
+##########################################################################################
+#
+# Script name: test_fetchers_dates.py
+#
+# Description: Tests published-date parsing for feed and API payloads.
+#
+##########################################################################################
+
+from datetime import datetime, timezone
+
+from ai_news_feed import fetchers
+
+
+def test_parse_published_handles_iso_and_rfc822_dates() -> None:
+    expected = datetime(2026, 3, 4, 15, 30, tzinfo=timezone.utc)
+
+    assert fetchers.parse_published({'published': '2026-03-04T15:30:00Z'}) == expected
+    assert fetchers.parse_published({'published': '2026-03-04T10:30:00-05:00'}) == expected
+    assert fetchers.parse_published({'published': 'Wed, 04 Mar 2026 15:30:00 GMT'}) == expected
+    assert fetchers.parse_published({'updated': 'Wed, 04 Mar 2026 10:30:00 -0500'}) == expected
+
+
+def test_parse_published_falls_back_to_later_candidates() -> None:
+    entry = {'published': 'not a date', 'updated': '2026-03-04 15:30:00'}
+    assert fetchers.parse_published(entry) == datetime(2026, 3, 4, 15, 30, tzinfo=timezone.utc)
+    assert fetchers.parse_published({'published': 'not a date'}) is None
+
+
+def test_parse_datetime_value_accepts_strings_and_epochs() -> None:
+    expected = datetime(2026, 3, 4, 15, 30, tzinfo=timezone.utc)
+
+    assert fetchers._parse_datetime_value('2026-03-04T15:30:00.000Z') == expected
+    assert fetchers._parse_datetime_value(int(expected.timestamp() * 1000)) == expected
+    assert fetchers._parse_datetime_value({'time': expected.timestamp()}) == expected
@@ -0,0 +1,78 @@
+##########################################################################################
+#
+# Script name: test_fetchers_feed_cache.py
+#
+# Description: Tests conditional-GET caching and body trimming for RSS sources.
+#
+##########################################################################################
+
+from ai_news_feed import fetchers
+
+
+RSS_BODY = b'''<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example</title>
+<item>
+  <title>Agent evals in practice</title>
+  <link>https://example.com/agent-evals</link>
+  <description>Notes from shipping evals.</description>
+  <pubDate>Wed, 04 Mar 2026 15:30:00 GMT</pubDate>
+</item>
+</channel></rss>
+'''
+
+
+class _Response:
+    def __init__(self, status_code: int, content: bytes = b'', headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+def test_fetch_rss_source_reuses_cached_items_on_not_modified(monkeypatch, tmp_path) -> None:
+    request_headers: list[dict] = []
+
+    def _fake_get(url: str, headers=None, timeout=None):
+        del url, timeout
+        request_headers.append(dict(headers or {}))
+        if headers and headers.get('If-None-Match') == '"v1"':
+            return _Response(status_code=304)
+        return _Response(
+            status_code=200,
+            content=RSS_BODY,
+            headers={'ETag': '"v1"', 'Content-Type': 'application/rss+xml; charset=utf-8'},
+        )
+
+    cache_file = tmp_path / 'feed_http_cache.json'
+    monkeypatch.setenv('FEED_HTTP_CACHE_FILE', str(cache_file))
+    monkeypatch.setattr(fetchers, '_FEED_HTTP_CACHE', None)
+    monkeypatch.setattr(
+        fetchers,
+        'requests',
+        type('Requests', (), {'get': staticmethod(_fake_get), 'RequestException': Exception}),
+    )
+    source = {'id': 'example-rss', 'type': 'rss', 'url': 'https://example.com/feed.xml', 'priority': 3}
+
+    first = fetchers.fetch_rss_source(source)
+    fetchers.save_feed_http_cache()
+    monkeypatch.setattr(fetchers, '_FEED_HTTP_CACHE', None)
+    second = fetchers.fetch_rss_source(source)
+
+    assert cache_file.exists()
+    assert 'If-None-Match' not in request_headers[0]
+    assert request_headers[1]['If-None-Match'] == '"v1"'
+    assert [article.title for article in second] == ['Agent evals in practice']
+    assert second[0].id == first[0].id
+    assert second[0].published_at == first[0].published_at
+    assert second[0].summary == first[0].summary
+
+
+def test_truncate_feed_body_keeps_leading_entries_and_closing_tail(monkeypatch) -> None:
+    monkeypatch.setattr(fetchers, 'FEED_TRUNCATE_MIN_BYTES', 0)
+    body = b'<rss><channel><item>1</item><item>2</item><item>3</item>\n</channel></rss>'
+
+    assert fetchers._truncate_feed_body(body, 2) == b'<rss><channel><item>1</item><item>2</item>\n</channel></rss>'
+    assert fetchers._truncate_feed_body(body, 3) == body
+    assert fetchers._truncate_feed_body(body, 5) == body
+    assert fetchers._truncate_feed_body(b'<feed><entry>a</entry><entry>b</entry></feed>', 1) == (
+        b'<feed><entry>a</entry></feed>'
+    )
@@ -93,3 +93,49 @@ def test_fetch_hackernews_source_returns_empty_when_topstories_fails(monkeypatch
     }
     articles = fetchers.fetch_hackernews_source(source)
     assert articles == []
+
+
+def test_fetch_hackernews_source_uses_single_algolia_search_when_enabled(monkeypatch) -> None:
+    requested: list[tuple[str, dict]] = []
+
+    def _fake_get(url: str, params=None, timeout=None):
+        del timeout
+        requested.append((url, dict(params or {})))
+        return _Response(
+            status_code=200,
+            payload={
+                'hits': [
+                    {
+                        'title': 'LLM agent benchmark notes',
+                        'url': 'https://example.com/hn-post',
+                        'created_at_i': 1772539200,
+                        'points': 25,
+                        'num_comments': 7,
+                    },
+                    {'title': 'Gardening tips', 'url': 'https://example.com/garden'},
+                    {'title': 'Ask HN: agents?', 'url': None},
+                ]
+            },
+        )
+
+    monkeypatch.setattr(
+        fetchers,
+        'requests',
+        type('Requests', (), {'get': staticmethod(_fake_get), 'RequestException': _RequestException}),
+    )
+
+    source = {
+        'id': 'hackernews-ai',
+        'type': 'hackernews',
+        'max_items': 50,
+        'keywords': ['llm', 'agent'],
+        'use_algolia': True,
+    }
+    articles = fetchers.fetch_hackernews_source(source)
+
+    assert len(requested) == 1
+    assert requested[0][0] == fetchers.HACKERNEWS_ALGOLIA_URL
+    assert requested[0][1]['hitsPerPage'] == 50
+    assert requested[0][1]['optionalWords'] == 'llm agent'
+    assert [article.title for article in articles] == ['LLM agent benchmark notes']
+    assert articles[0].metrics == {'points': 25.0, 'comments': 7.0}
@@ -0,0 +1,121 @@
+##########################################################################################
+#
+# Script name: test_fetchers_linkedin.py
+#
+# Description: Tests LinkedIn payload text and profile URL extraction.
+#
+##########################################################################################
+
+from datetime import datetime, timezone
+
+from ai_news_feed import fetchers
+
+
+def test_extract_text_prefers_commentary_keys_over_other_fields() -> None:
+    payload = {
+        'id': 'urn:li:share:1',
+        'lifecycleState': 'PUBLISHED',
+        'content': {'article': {'title': 'Linked article title'}},
+        'commentary': '',
+        'specificContent': {
+            'com.linkedin.ugc.ShareContent': {
+                'shareCommentary': {'text': 'How we wired agents into code review.'},
+            }
+        },
+    }
+    assert fetchers._extract_text(payload) == 'urn:li:share:1'
+    assert fetchers._extract_text({'meta': payload['specificContent'], 'title': ''}) == (
+        'How we wired agents into code review.'
+    )
+
+
+def test_extract_text_handles_deep_nesting_without_recursion_limit() -> None:
+    payload: dict = {'text': 'deepest'}
+    for _ in range(5000):
+        payload = {'child': [None, {}, payload]}
+    assert fetchers._extract_text(payload) == 'deepest'
+    assert fetchers._extract_text([None, 3, {'text': ''}]) == ''
+
+
+def test_extract_linkedin_profile_url_accepts_profile_and_company_urls() -> None:
+    assert fetchers._extract_linkedin_profile_url(' HTTPS://WWW.LinkedIn.com/in/builder/ ') == (
+        'https://www.linkedin.com/in/builder/'
+    )
+    assert fetchers._extract_linkedin_profile_url('http://linkedin.com/company/acme') == 'http://linkedin.com/company/acme'
+    assert fetchers._extract_linkedin_profile_url('https://linkedin.com/feed/') == ''
+    assert fetchers._extract_linkedin_profile_url('urn:li:person:123') == ''
+
+
+def test_fetch_linkedin_source_keeps_reported_zero_likes_and_skips_blank_dates(monkeypatch) -> None:
+    class _Response:
+        status_code = 200
+
+        def json(self):
+            return {
+                'elements': [
+                    {
+                        'id': 'urn:li:share:1',
+                        'commentary': 'Shipping agent evals to every pull request.',
+                        'publishedAt': '',
+                        'lastModifiedAt': 1772539200000,
+                        'socialDetail': {'numLikes': 0, 'numImpressions': 900, 'commentCount': 3},
+                    }
+                ]
+            }
+
+    def _fake_get(url: str, headers=None, params=None, timeout=None):
+        del url, headers, params, timeout
+        return _Response()
+
+    monkeypatch.setenv('LINKEDIN_ACCESS_TOKEN', 'token')
+    monkeypatch.delenv('LINKEDIN_AUTHOR_URN', raising=False)
+    monkeypatch.setattr(
+        fetchers,
+        'requests',
+        type('Requests', (), {'get': staticmethod(_fake_get), 'RequestException': Exception}),
+    )
+
+    articles = fetchers.fetch_linkedin_source(
+        {'id': 'linkedin-test', 'type': 'linkedin', 'author_urn': 'urn:li:person:123'}
+    )
+
+    assert len(articles) == 1
+    assert articles[0].metrics == {'points': 0.0, 'comments': 3.0}
+    assert articles[0].published_at == datetime(2026, 3, 3, 12, 0, tzinfo=timezone.utc)
+
+
+def test_fetch_linkedin_source_treats_zero_timestamps_as_missing(monkeypatch) -> None:
+    class _Response:
+        status_code = 200
+
+        def json(self):
+            return {
+                'elements': [
+                    {
+                        'id': 'urn:li:share:2',
+                        'commentary': 'Rolling out agent runbooks across the platform team.',
+                        'publishedAt': 0,
+                        'lastModifiedAt': 0,
+                        'createdAt': 1772539200000,
+                    }
+                ]
+            }
+
+    def _fake_get(url: str, headers=None, params=None, timeout=None):
+        del url, headers, params, timeout
+        return _Response()
+
+    monkeypatch.setenv('LINKEDIN_ACCESS_TOKEN', 'token')
+    monkeypatch.delenv('LINKEDIN_AUTHOR_URN', raising=False)
+    monkeypatch.setattr(
+        fetchers,
+        'requests',
+        type('Requests', (), {'get': staticmethod(_fake_get), 'RequestException': Exception}),
+    )
+
+    articles = fetchers.fetch_linkedin_source(
+        {'id': 'linkedin-test', 'type': 'linkedin', 'author_urn': 'urn:li:person:123'}
+    )
+
+    assert len(articles) == 1
+    assert articles[0].published_at == datetime(2026, 3, 3, 12, 0, tzinfo=timezone.utc)
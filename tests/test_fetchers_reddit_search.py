@@ -45,7 +45,7 @@ def test_fetch_reddit_search_source_parses_posts(monkeypatch) -> None:
         assert params.get('t') == 'day'
         return _Response(200, payload)
 
-    monkeypatch.setattr(fetchers.requests, 'get', _fake_get)
+    monkeypatch.setattr(fetchers, '_http_get', _fake_get)
 
     source = {
         'id': 'reddit-ai-workflows-search',
@@ -94,7 +94,7 @@ def test_fetch_reddit_search_source_uses_rss_fallback_on_forbidden(monkeypatch)
             return response
         return _Response(404, {})
 
-    monkeypatch.setattr(fetchers.requests, 'get', _fake_get)
+    monkeypatch.setattr(fetchers, '_http_get', _fake_get)
 
     source = {
         'id': 'reddit-ai-workflows-search',
@@ -140,3 +140,109 @@ def test_fetch_x_source_builds_short_headline_from_api_text(monkeypatch) -> None
     assert len(articles) == 1
     assert articles[0].title == 'Context Hub'
     assert articles[0].summary.startswith("I'm excited to announce Context Hub")
+
+
+def test_fetch_x_source_follows_next_token_up_to_target_items(monkeypatch) -> None:
+    requested_tokens: list[str | None] = []
+
+    def _tweet(tweet_id: str) -> dict:
+        return {'id': tweet_id, 'text': f'Agent workflow notes {tweet_id}', 'author_id': '42'}
+
+    def _fake_get(url: str, headers=None, params=None, timeout: int = 0):
+        del url, headers, timeout
+        token = (params or {}).get('next_token')
+        requested_tokens.append(token)
+        users = {'users': [{'id': '42', 'username': 'builder'}]}
+        if token is None:
+            return _FakeResponse(
+                status_code=200,
+                payload={'data': [_tweet('1'), _tweet('2')], 'includes': users, 'meta': {'next_token': 'page-2'}},
+            )
+        if token == 'page-2':
+            return _FakeResponse(
+                status_code=200,
+                payload={'data': [_tweet('3'), _tweet('4')], 'includes': users, 'meta': {'next_token': 'page-3'}},
+            )
+        return _FakeResponse(status_code=200, payload={'data': [_tweet('5')], 'includes': users})
+
+    monkeypatch.setenv('X_BEARER_TOKEN', 'token')
+    monkeypatch.setattr(fetchers, 'requests', type('Requests', (), {'get': staticmethod(_fake_get), 'RequestException': Exception}))
+
+    articles = fetchers.fetch_x_source(
+        {
+            'id': 'x-test-builder',
+            'type': 'x',
+            'query': 'from:builder',
+            'max_items': 10,
+            'target_items': 13,
+        }
+    )
+
+    assert requested_tokens == [None, 'page-2', 'page-3']
+    assert [article.url for article in articles] == [
+        f'https://x.com/builder/status/{tweet_id}' for tweet_id in ('1', '2', '3', '4', '5')
+    ]
+
+
+def test_fetch_x_source_without_target_items_makes_one_request(monkeypatch) -> None:
+    api_calls: list[str | None] = []
+
+    def _fake_get(url: str, headers=None, params=None, timeout: int = 0):
+        del headers, timeout
+        if 'api.x.com/2/tweets/search/recent' not in url:
+            return _FakeResponse(status_code=404)
+        api_calls.append((params or {}).get('next_token'))
+        return _FakeResponse(
+            status_code=200,
+            payload={
+                'data': [{'id': '1', 'text': 'Agent workflow notes', 'author_id': '42'}],
+                'includes': {'users': [{'id': '42', 'username': 'builder'}]},
+                'meta': {'next_token': 'page-2'},
+            },
+        )
+
+    monkeypatch.setenv('X_BEARER_TOKEN', 'token')
+    monkeypatch.setattr(fetchers, 'requests', type('Requests', (), {'get': staticmethod(_fake_get), 'RequestException': Exception}))
+
+    articles = fetchers.fetch_x_source({'id': 'x-test-builder', 'type': 'x', 'query': 'from:builder', 'max_items': 10})
+
+    assert api_calls == [None]
+    assert [article.url for article in articles] == ['https://x.com/builder/status/1']
+
+
+def test_fetch_x_source_stops_after_max_pages_of_empty_results(monkeypatch) -> None:
+    api_calls: list[str | None] = []
+
+    def _fake_get(url: str, headers=None, params=None, timeout: int = 0):
+        del headers, timeout
+        if 'api.x.com/2/tweets/search/recent' not in url:
+            return _FakeResponse(status_code=404)
+        token = (params or {}).get('next_token')
+        api_calls.append(token)
+        return _FakeResponse(status_code=200, payload={'data': [], 'meta': {'next_token': f'after-{len(api_calls)}'}})
+
+    monkeypatch.setenv('X_BEARER_TOKEN', 'token')
+    monkeypatch.setattr(fetchers, 'requests', type('Requests', (), {'get': staticmethod(_fake_get), 'RequestException': Exception}))
+
+    articles = fetchers.fetch_x_source(
+        {
+            'id': 'x-test-quiet',
+            'type': 'x',
+            'query': 'from:quiet',
+            'max_items': 10,
+            'target_items': 50,
+        }
+    )
+
+    assert articles == []
+    assert len(api_calls) == fetchers.X_MAX_PAGES == 5
+
+
+def test_extract_x_username_accepts_handles_and_profile_urls() -> None:
+    assert fetchers._extract_x_username(' @builder ') == 'builder'
+    assert fetchers._extract_x_username('https://x.com/builder/status/1?s=20') == 'builder'
+    assert fetchers._extract_x_username('http://twitter.com/build_er#top') == 'build_er'
+    assert fetchers._extract_x_username('@https://x.com/builder') == 'builder'
+    assert fetchers._extract_x_username('https://x.com/') == ''
+    assert fetchers._extract_x_username('https://example.com/builder') == ''
+    assert fetchers._extract_x_username('a_name_that_is_too_long') == ''
@@ -7,7 +7,10 @@
 ##########################################################################################
 
 import logging
+import sys
+import types
 
+from ai_news_feed import llm_utils
 from ai_news_feed.llm_utils import call_chat_completion_json, is_cost_minimization_enabled, select_min_cost_model
 
 
@@ -87,3 +90,20 @@ def test_call_chat_completion_json_retries_without_temperature(monkeypatch) -> N
     assert isinstance(selection_info, dict)
     assert temperature_retry is True
     assert len(client.chat.completions.calls) == 2
+
+
+def test_create_openai_client_reuses_one_client_per_key(monkeypatch) -> None:
+    created: list[str] = []
+
+    class _FakeOpenAI:
+        def __init__(self, api_key: str, **kwargs) -> None:
+            del kwargs
+            created.append(api_key)
+
+    monkeypatch.setitem(sys.modules, 'openai', types.SimpleNamespace(OpenAI=_FakeOpenAI))
+    monkeypatch.setattr(llm_utils, '_OPENAI_CLIENTS', {})
+
+    first = llm_utils.create_openai_client('key-a')
+    assert llm_utils.create_openai_client('key-a') is first
+    assert llm_utils.create_openai_client('key-b') is not first
+    assert created == ['key-a', 'key-b']
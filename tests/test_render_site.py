@@ -0,0 +1,84 @@
+##########################################################################################
+#
+# Script name: test_render_site.py
+#
+# Description: Tests static site output written by write_site.
+#
+##########################################################################################
+
+import json
+import os
+
+from ai_news_feed import render
+from ai_news_feed.models import DailyFeed
+from ai_news_feed.render import write_site
+
+
+def _feed() -> DailyFeed:
+    return DailyFeed(
+        date='2026-03-03',
+        generated_at='2026-03-03T12:00:00Z',
+        title='Daily AI Feed - 2026-03-03',
+        sections={},
+        intro='Intro',
+    )
+
+
+def test_write_site_emits_compact_json_unless_pretty_requested(monkeypatch, tmp_path) -> None:
+    monkeypatch.delenv('AI_NEWS_PRETTY_JSON', raising=False)
+    write_site(_feed(), str(tmp_path / 'compact'))
+    compact = (tmp_path / 'compact' / 'data' / '2026-03-03.json').read_text(encoding='utf-8')
+
+    monkeypatch.setenv('AI_NEWS_PRETTY_JSON', '1')
+    write_site(_feed(), str(tmp_path / 'pretty'))
+    pretty = (tmp_path / 'pretty' / 'data' / '2026-03-03.json').read_text(encoding='utf-8')
+
+    assert '\n' not in compact
+    assert '\n  "date": "2026-03-03"' in pretty
+    assert json.loads(compact) == json.loads(pretty)
+    archive = json.loads((tmp_path / 'compact' / 'data' / 'archive.json').read_text(encoding='utf-8'))
+    assert [entry['date'] for entry in archive] == ['2026-03-03']
+
+
+def test_write_site_archive_round_trips_with_and_without_orjson(monkeypatch, tmp_path) -> None:
+    feed = _feed()
+    feed.intro = 'Café agents — weekly notes'
+    write_site(feed, str(tmp_path))
+
+    monkeypatch.setattr(render, 'orjson', None)
+    feed.date = '2026-03-04'
+    write_site(feed, str(tmp_path))
+
+    archive = render._read_archive(tmp_path / 'data' / 'archive.json')
+    assert [entry['date'] for entry in archive] == ['2026-03-04', '2026-03-03']
+    payload = json.loads((tmp_path / 'data' / '2026-03-03.json').read_bytes())
+    assert payload['intro'] == 'Café agents — weekly notes'
+
+
+def test_render_archive_page_points_assets_one_level_up() -> None:
+    archive = [{'date': '2026-03-02', 'title': 'Daily AI Feed - 2026-03-02'}]
+    index_html = render._render_page(_feed(), archive)
+    archive_html = render._render_archive_page(_feed(), archive)
+
+    assert 'href="./style.css"' in index_html
+    assert 'href="./archive/2026-03-02.html"' in index_html
+    assert 'href="../style.css"' in archive_html
+    assert 'href="../feed.xml"' in archive_html
+    assert 'href="./2026-03-02.html"' in archive_html
+    assert '<title>Daily AI Feed - 2026-03-03 - Archive</title>' in archive_html
+
+
+def test_write_site_leaves_unchanged_static_assets_alone(tmp_path) -> None:
+    write_site(_feed(), str(tmp_path))
+    style_path = tmp_path / 'style.css'
+    nojekyll_path = tmp_path / '.nojekyll'
+    os.utime(style_path, (1_000_000, 1_000_000))
+    os.utime(nojekyll_path, (1_000_000, 1_000_000))
+
+    write_site(_feed(), str(tmp_path))
+    assert style_path.stat().st_mtime == 1_000_000
+    assert nojekyll_path.stat().st_mtime == 1_000_000
+
+    style_path.write_text('stale', encoding='utf-8')
+    write_site(_feed(), str(tmp_path))
+    assert style_path.read_bytes() == render.CSS_BYTES
@@ -0,0 +1,125 @@
+##########################################################################################
+#
+# Script name: test_summarizer.py
+#
+# Description: Tests per-section summary enrichment and usage accounting.
+#
+##########################################################################################
+
+import json
+import time
+
+from ai_news_feed import summarizer
+from ai_news_feed.models import Article
+
+
+def _article(article_id: str) -> Article:
+    return Article(
+        id=article_id,
+        title=f'Story {article_id}',
+        url=f'https://example.com/{article_id}',
+        summary='Agents now open pull requests with eval results attached.',
+        source_name='Example',
+        source_type='rss',
+        domain='example.com',
+        published_at=None,
+        priority=1.0,
+    )
+
+
+class _Message:
+    def __init__(self, content: str) -> None:
+        self.content = content
+
+
+class _Response:
+    usage = None
+
+    def __init__(self, content: str) -> None:
+        self.choices = [type('Choice', (), {'message': _Message(content)})()]
+
+
+def _install_fake_model(monkeypatch, cache_file) -> list[list[str]]:
+    sent_ids: list[list[str]] = []
+
+    def _fake_call(client, logger, preferred_model, operation, system_prompt, user_prompt):
+        del client, logger, operation, system_prompt
+        rows = json.loads(user_prompt.split('Input JSON:\n', 1)[1].split('\n\n', 1)[0])
+        sent_ids.append([row['id'] for row in rows])
+        items = [{'id': row['id'], 'summary': f'Model copy for {row["id"]}.'} for row in rows]
+        return _Response(json.dumps({'items': items})), preferred_model, {}, False
+
+    monkeypatch.setenv('OPENAI_API_KEY', 'key')
+    monkeypatch.setenv('ENRICHMENT_CACHE_FILE', str(cache_file))
+    monkeypatch.setattr(summarizer, '_ENRICHMENT_CACHE', None)
+    monkeypatch.setattr(summarizer, 'create_openai_client', lambda api_key: object())
+    monkeypatch.setattr(summarizer, 'call_chat_completion_json', _fake_call)
+    return sent_ids
+
+
+def test_enrich_summaries_runs_sections_concurrently_and_merges_usage(monkeypatch) -> None:
+    def _fake_enrichment(section_slug, articles, usage_totals):
+        time.sleep(0.05 if section_slug == 'engineering' else 0.0)
+        usage_totals.call_count += 1
+        usage_totals.prompt_tokens += 100
+        if section_slug == 'for-fun':
+            return None
+        return {
+            article.id: {'summary': f'{section_slug} summary', 'why_it_matters': 'Direct: useful.'}
+            for article in articles
+        }
+
+    logged: list[tuple] = []
+    monkeypatch.setattr(summarizer, '_try_openai_enrichment', _fake_enrichment)
+    monkeypatch.setattr(
+        summarizer.LlmUsageTotals,
+        'log_summary',
+        lambda self, logger, label='': logged.append((self.call_count, self.prompt_tokens)),
+    )
+    sections = {
+        'engineering': [_article('a'), _article('b')],
+        'business': [_article('c')],
+        'for-fun': [_article('d')],
+    }
+
+    summarizer.enrich_summaries(sections)
+
+    assert [article.summary_text for article in sections['engineering']] == ['engineering summary'] * 2
+    assert sections['business'][0].summary_text == 'business summary'
+    assert sections['business'][0].why_it_matters == 'Direct: useful.'
+    assert sections['for-fun'][0].summary_text == 'Agents now open pull requests with eval results attached.'
+    assert sections['for-fun'][0].suggested_action
+    assert logged == [(3, 300)]
+
+
+def test_try_openai_enrichment_only_sends_uncached_articles(monkeypatch, tmp_path) -> None:
+    cache_file = tmp_path / 'enrichment_cache.json'
+    sent_ids = _install_fake_model(monkeypatch, cache_file)
+
+    summarizer._try_openai_enrichment('engineering', [_article('a')], summarizer.LlmUsageTotals())
+    summarizer.save_enrichment_cache()
+    monkeypatch.setattr(summarizer, '_ENRICHMENT_CACHE', None)
+    usage = summarizer.LlmUsageTotals()
+    output = summarizer._try_openai_enrichment('engineering', [_article('a'), _article('b')], usage)
+    summarizer._try_openai_enrichment('engineering', [_article('b')], usage)
+    edited = _article('a')
+    edited.summary = 'Agents now open pull requests with eval results and cost notes attached.'
+    summarizer._try_openai_enrichment('engineering', [edited], usage)
+
+    assert cache_file.exists()
+    assert sent_ids == [['a'], ['b'], ['a']]
+    assert output['a']['summary'] == 'Model copy for a.'
+    assert output['b']['summary'] == 'Model copy for b.'
+    assert usage.call_count == 2
+
+
+def test_try_openai_enrichment_misses_cache_after_prompt_edit(monkeypatch, tmp_path) -> None:
+    sent_ids = _install_fake_model(monkeypatch, tmp_path / 'enrichment_cache.json')
+    monkeypatch.setattr(summarizer, '_load_section_prompt', lambda section_slug: 'Favor shipped workflows.')
+
+    summarizer._try_openai_enrichment('engineering', [_article('a')], summarizer.LlmUsageTotals())
+    summarizer._try_openai_enrichment('engineering', [_article('a')], summarizer.LlmUsageTotals())
+    monkeypatch.setattr(summarizer, '_load_section_prompt', lambda section_slug: 'Favor eval tooling.')
+    summarizer._try_openai_enrichment('engineering', [_article('a')], summarizer.LlmUsageTotals())
+
+    assert sent_ids == [['a'], ['a']]
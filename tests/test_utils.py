@@ -0,0 +1,45 @@
+##########################################################################################
+#
+# Script name: test_utils.py
+#
+# Description: Tests shared URL and text helpers.
+#
+##########################################################################################
+
+from ai_news_feed.utils import canonicalize_url, canonicalize_with_domain, extract_domain, strip_html, url_dedupe_key
+
+
+def test_canonicalize_with_domain_matches_separate_helpers() -> None:
+    url = 'HTTPS://WWW.Example.com/post?utm_source=feed&id=7#comments'
+
+    canonical_url, domain = canonicalize_with_domain(url)
+
+    assert canonical_url == 'https://www.example.com/post?id=7'
+    assert canonical_url == canonicalize_url(url)
+    assert domain == 'example.com' == extract_domain(canonical_url)
+    assert canonicalize_with_domain('') == ('', '')
+
+
+def test_canonicalize_with_domain_fast_path_matches_full_parse() -> None:
+    assert canonicalize_with_domain('https://www.example.com/posts/agent-evals') == (
+        'https://www.example.com/posts/agent-evals',
+        'example.com',
+    )
+    assert canonicalize_with_domain('https://Example.com/Posts') == ('https://example.com/Posts', 'example.com')
+    assert canonicalize_with_domain('https:////post') == ('https://post', '')
+    assert canonicalize_with_domain('http://example.com/a;b') == ('http://example.com/a;b', 'example.com')
+
+
+def test_strip_html_drops_script_and_style_blocks() -> None:
+    text = '<p>Hello <b>world</b></p><SCRIPT type="x">alert(1)</script><style>p {}</style> &amp; more'
+    assert strip_html(text) == 'Hello world & more'
+
+
+def test_url_dedupe_key_ignores_cosmetic_url_differences() -> None:
+    key = url_dedupe_key('https://www.example.com/post/?utm_source=x')
+
+    assert key == 'example.com/post'
+    assert url_dedupe_key('http://example.com:80/post?ref=hn') == key
+    assert url_dedupe_key('https://example.com:443/post#comments') == key
+    assert url_dedupe_key('https://example.com/post?id=2') == 'example.com/post?id=2'
+    assert url_dedupe_key('') == ''